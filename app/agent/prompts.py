@@ -1,5 +1,7 @@
 """System prompts and templates for the review agent."""
 
+import functools
+
 SYSTEM_PROMPT_BASE = """\
 You are an expert code reviewer for pull requests. Your role is to analyze code changes \
 and provide helpful, actionable feedback.
@@ -44,20 +46,24 @@ For each issue found, provide:
 - Acknowledge good code and patterns with PRAISE comments
 """
 
-SYSTEM_PROMPT_WITH_RULES = """\
-{base_prompt}
+# Everything preceding the custom rules is constant, so it is built once
+_SYSTEM_PROMPT_RULES_PREFIX = f"""\
+{SYSTEM_PROMPT_BASE}
 
 ## Custom Rules
 
 The repository has defined the following custom review rules that MUST be enforced:
 
-{custom_rules}
 """
 
 
+@functools.lru_cache(maxsize=32)
 def build_system_prompt(custom_rules: str | None = None) -> str:
     """Build the system prompt for the review agent.
 
+    Results are memoized per ``custom_rules`` value, since the same rules
+    blob is reused across every review of a repository.
+
     Args:
         custom_rules: Optional custom rules from .claude/rules/*.md files.
 
@@ -65,18 +71,42 @@ def build_system_prompt(custom_rules: str | None = None) -> str:
         Complete system prompt.
     """
     if custom_rules:
-        return SYSTEM_PROMPT_WITH_RULES.format(
-            base_prompt=SYSTEM_PROMPT_BASE,
-            custom_rules=custom_rules,
-        )
+        return f"{_SYSTEM_PROMPT_RULES_PREFIX}{custom_rules}\n"
     return SYSTEM_PROMPT_BASE
 
 
-REVIEW_PROMPT_TEMPLATE = """\
+def build_review_prompt(
+    pr_title: str,
+    pr_body: str | None,
+    file_path: str,
+    file_diff: str,
+    file_content: str | None = None,
+) -> str:
+    """Build the review prompt for a specific file.
+
+    Args:
+        pr_title: The PR title.
+        pr_body: The PR description (may be None or empty).
+        file_path: Path to the file being reviewed.
+        file_diff: The unified diff for the file.
+        file_content: Optional full file content for context.
+
+    Returns:
+        Complete review prompt.
+    """
+    # Handle empty body
+    body = pr_body if pr_body else "(No description provided)"
+
+    # Build file content section if provided
+    content_section = (
+        f"### Full File Content (for context)\n\n```\n{file_content}\n```\n" if file_content else ""
+    )
+
+    return f"""\
 ## Pull Request Context
 
 **Title**: {pr_title}
-**Description**: {pr_body}
+**Description**: {body}
 
 ## File to Review
 
@@ -88,7 +118,7 @@ REVIEW_PROMPT_TEMPLATE = """\
 {file_diff}
 ```
 
-{file_content_section}
+{content_section}
 
 ## Your Task
 
@@ -108,52 +138,30 @@ For each issue found, specify:
 If the code looks good with no issues, provide a brief PRAISE comment acknowledging the good work.
 """
 
-FILE_CONTENT_SECTION = """\
-### Full File Content (for context)
 
-```
-{content}
-```
-"""
-
-
-def build_review_prompt(
-    pr_title: str,
-    pr_body: str | None,
-    file_path: str,
-    file_diff: str,
-    file_content: str | None = None,
+def build_summary_prompt(
+    pr_title: str,  # noqa: ARG001
+    pr_body: str | None,  # noqa: ARG001
+    file_results: list[dict[str, str]],
 ) -> str:
-    """Build the review prompt for a specific file.
+    """Build the prompt for generating a review summary.
 
     Args:
-        pr_title: The PR title.
-        pr_body: The PR description (may be None or empty).
-        file_path: Path to the file being reviewed.
-        file_diff: The unified diff for the file.
-        file_content: Optional full file content for context.
+        pr_title: The PR title (reserved for future use).
+        pr_body: The PR description (reserved for future use).
+        file_results: List of dicts with file_path and summary for each reviewed file.
 
     Returns:
-        Complete review prompt.
+        Complete summary prompt.
     """
-    # Handle empty body
-    body = pr_body if pr_body else "(No description provided)"
-
-    # Build file content section if provided
-    content_section = ""
-    if file_content:
-        content_section = FILE_CONTENT_SECTION.format(content=file_content)
-
-    return REVIEW_PROMPT_TEMPLATE.format(
-        pr_title=pr_title,
-        pr_body=body,
-        file_path=file_path,
-        file_diff=file_diff,
-        file_content_section=content_section,
-    )
+    # Build file summaries section
+    summaries = []
+    for result in file_results:
+        summaries.append(f"- **{result['file_path']}**: {result.get('summary', 'Reviewed')}")
 
+    file_summaries = "\n".join(summaries) if summaries else "(No files reviewed)"
 
-SUMMARY_PROMPT_TEMPLATE = """\
+    return f"""\
 ## Review Summary Task
 
 You have reviewed the following files in this pull request:
@@ -173,28 +181,3 @@ Keep the summary concise but informative. Use markdown formatting.
 
 If no significant issues were found, acknowledge the good work.
 """
-
-
-def build_summary_prompt(
-    pr_title: str,  # noqa: ARG001
-    pr_body: str | None,  # noqa: ARG001
-    file_results: list[dict[str, str]],
-) -> str:
-    """Build the prompt for generating a review summary.
-
-    Args:
-        pr_title: The PR title (reserved for future use).
-        pr_body: The PR description (reserved for future use).
-        file_results: List of dicts with file_path and summary for each reviewed file.
-
-    Returns:
-        Complete summary prompt.
-    """
-    # Build file summaries section
-    summaries = []
-    for result in file_results:
-        summaries.append(f"- **{result['file_path']}**: {result.get('summary', 'Reviewed')}")
-
-    file_summaries = "\n".join(summaries) if summaries else "(No files reviewed)"
-
-    return SUMMARY_PROMPT_TEMPLATE.format(file_summaries=file_summaries)
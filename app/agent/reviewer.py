@@ -2,26 +2,95 @@
 
 from __future__ import annotations
 
-import fnmatch
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from strands import Agent
-from strands.models import BedrockModel
-
 from app.agent.prompts import build_review_prompt, build_summary_prompt, build_system_prompt
 from app.models.comment import Category, CommentType, ReviewComment, Severity
 from app.utils.logging import get_logger
 
 if TYPE_CHECKING:
+    from strands import Agent
+
     from app.models.config import AgentConfig
     from app.models.file_diff import FileDiff
     from app.models.pull_request import PullRequest
 
 logger = get_logger("agent.reviewer")
 
+# Keyword -> severity rules, applied in order so later matches take precedence
+_SEVERITY_KEYWORDS: tuple[tuple[tuple[str, ...], Severity], ...] = (
+    (("error", "bug"), Severity.WARNING),
+    (("critical", "security"), Severity.ERROR),
+    (("good", "well done"), Severity.PRAISE),
+)
+
+# Keyword -> category rules, first match wins
+_CATEGORY_KEYWORDS: tuple[tuple[str, Category], ...] = (
+    ("security", Category.SECURITY),
+    ("performance", Category.PERFORMANCE),
+    ("bug", Category.BUG),
+    ("style", Category.STYLE),
+)
+
+# All classification keywords, matched case-insensitively in a single scan
+_KEYWORD_RE = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in sorted(
+            {kw for keywords, _ in _SEVERITY_KEYWORDS for kw in keywords}
+            | {kw for kw, _ in _CATEGORY_KEYWORDS},
+            key=len,
+            reverse=True,
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# Severity markers sit near the top of LLM reviews, so classification only
+# scans this many leading characters regardless of response length
+_CLASSIFY_WINDOW = 2048
+
+
+# Agent responses keyed by a digest of model, system prompt and review prompt.
+# Module-level so identical reviews (retries, duplicated or generated files)
+# skip Bedrock across ReviewAgent instances.
+_RESPONSE_CACHE_SIZE = 256
+_response_cache: OrderedDict[bytes, str] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Upper bound on in-flight Bedrock calls across all reviews in the process.
+# Per-review fan-out is capped by AgentConfig.max_parallel, but several
+# reviews can run at once and would otherwise trip Bedrock throttling.
+_MAX_CONCURRENT_INVOCATIONS = 16
+_invocation_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_INVOCATIONS)
+
+
+def clear_response_cache() -> None:
+    """Drop all cached agent responses."""
+    with _response_cache_lock:
+        _response_cache.clear()
 
-@dataclass
+
+def _extract_text(response: object) -> str:
+    """Extract the text of an agent response.
+
+    Args:
+        response: The Strands agent result.
+
+    Returns:
+        The response message as text.
+    """
+    message = getattr(response, "message", None)
+    return str(message) if message is not None else str(response)
+
+
+@dataclass(slots=True)
 class ReviewResult:
     """Result of reviewing a single file."""
 
@@ -46,24 +115,37 @@ class ReviewAgent:
             config: Agent configuration.
             custom_rules: Optional custom rules from repository.
         """
+        # Strands (and the boto3 stack behind it) is imported on first use rather
+        # than at module load, so importing the webhook path stays cheap on cold starts
+        from strands.models import BedrockModel  # noqa: PLC0415
+
         self.config = config
         self.custom_rules = custom_rules
 
         # Build system prompt
         self.system_prompt = build_system_prompt(custom_rules)
 
-        # Create Bedrock model
+        # Create Bedrock model (shared across threads; boto3 clients are thread-safe).
+        # Responses stream via ConverseStream and are accumulated by Strands.
         self.model = BedrockModel(
             model_id=config.model_id,
             temperature=config.temperature,
+            streaming=True,
         )
 
-        # Create Strands agent
-        self.agent = Agent(
-            model=self.model,
-            system_prompt=self.system_prompt,
+        # Exclusion patterns are compiled once per distinct pattern list
+        self._match_excluded = config.excluded_matcher
+
+        # Response cache keys are salted with everything that shapes the answer
+        self._cache_prefix = hashlib.blake2b(
+            f"{config.model_id}\0{config.temperature}\0{self.system_prompt}\0".encode(),
+            digest_size=16,
         )
 
+        # Strands agents hold per-invocation state, so each thread gets its own
+        self._local = threading.local()
+        self._local.agent = self._create_agent()
+
         logger.info(
             "ReviewAgent initialized",
             extra={
@@ -72,6 +154,81 @@ class ReviewAgent:
             },
         )
 
+    def _create_agent(self) -> Agent:
+        """Create a Strands agent bound to the shared Bedrock model.
+
+        Returns:
+            A new Strands agent.
+        """
+        # The system prompt is identical for every file in a review, so a cache
+        # point after it lets Bedrock reuse the prefix. Per-file prompts are
+        # dynamic and deliberately left uncached. Streamed chunks are not echoed
+        # to stdout; only the accumulated result is used.
+        from strands import Agent  # noqa: PLC0415
+
+        return Agent(
+            model=self.model,
+            system_prompt=[
+                {"text": self.system_prompt},
+                {"cachePoint": {"type": "default"}},
+            ],
+            callback_handler=None,
+        )
+
+    @property
+    def agent(self) -> Agent:
+        """Get the Strands agent for the calling thread."""
+        agent: Agent | None = getattr(self._local, "agent", None)
+        if agent is None:
+            agent = self._local.agent = self._create_agent()
+        return agent
+
+    def _invoke(self, prompt: str) -> str:
+        """Invoke the calling thread's agent with a fresh conversation.
+
+        Each prompt is self-contained, so history from earlier files (or earlier
+        reviews, when the agent is reused) is dropped before the call.
+
+        Args:
+            prompt: The prompt to send.
+
+        Returns:
+            The agent's response text.
+        """
+        agent = self.agent
+        agent.messages.clear()
+        with _invocation_slots:
+            response = agent(prompt)
+        return _extract_text(response)
+
+    def _run_llm(self, prompt: str) -> str:
+        """Run a review prompt, reusing the cached response for identical prompts.
+
+        Args:
+            prompt: The review prompt.
+
+        Returns:
+            The agent's response text.
+        """
+        hasher = self._cache_prefix.copy()
+        hasher.update(prompt.encode())
+        key = hasher.digest()
+
+        with _response_cache_lock:
+            cached = _response_cache.get(key)
+            if cached is not None:
+                _response_cache.move_to_end(key)
+                return cached
+
+        response_text = self._invoke(prompt)
+
+        with _response_cache_lock:
+            _response_cache[key] = response_text
+            if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+
+        return response_text
+
     def _should_skip_file(self, file_diff: FileDiff) -> tuple[bool, str | None]:
         """Check if a file should be skipped.
 
@@ -86,9 +243,9 @@ class ReviewAgent:
             return True, "Binary file"
 
         # Skip files matching exclusion patterns
-        for pattern in self.config.excluded_patterns:
-            if fnmatch.fnmatch(file_diff.filename, pattern):
-                return True, f"Matches exclusion pattern: {pattern}"
+        pattern = self._match_excluded(file_diff.filename)
+        if pattern is not None:
+            return True, f"Matches exclusion pattern: {pattern}"
 
         return False, None
 
@@ -111,19 +268,40 @@ class ReviewAgent:
         # Check if file should be skipped
         should_skip, skip_reason = self._should_skip_file(file_diff)
         if should_skip:
-            logger.info(
-                "Skipping file",
-                extra={
-                    "file_path": file_diff.filename,
-                    "reason": skip_reason,
-                },
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Skipping file",
+                    extra={
+                        "file_path": file_diff.filename,
+                        "reason": skip_reason,
+                    },
+                )
             return ReviewResult(
                 file_path=file_diff.filename,
                 skipped=True,
                 skip_reason=skip_reason,
             )
 
+        # Trivial changes (a couple of lines, whitespace-only patches) are not
+        # worth a Bedrock round-trip
+        if (
+            file_diff.total_changes <= self.config.min_review_changes
+            or not (file_diff.patch or "").strip()
+        ):
+            return ReviewResult(
+                file_path=file_diff.filename,
+                comments=[
+                    ReviewComment(
+                        body="Looks good.",
+                        comment_type=CommentType.SUMMARY,
+                        severity=Severity.PRAISE,
+                        category=Category.BEST_PRACTICE,
+                        file_path=file_diff.filename,
+                    )
+                ],
+                summary="Trivial change",
+            )
+
         # Build review prompt
         prompt = build_review_prompt(
             pr_title=pr.title,
@@ -133,19 +311,19 @@ class ReviewAgent:
             file_content=file_content,
         )
 
-        logger.info(
-            "Reviewing file",
-            extra={
-                "file_path": file_diff.filename,
-                "additions": file_diff.additions,
-                "deletions": file_diff.deletions,
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Reviewing file",
+                extra={
+                    "file_path": file_diff.filename,
+                    "additions": file_diff.additions,
+                    "deletions": file_diff.deletions,
+                },
+            )
 
         try:
             # Call the agent
-            response = self.agent(prompt)
-            response_text = str(response.message) if hasattr(response, "message") else str(response)
+            response_text = self._run_llm(prompt)
 
             # Parse response into comments
             comments = self._parse_review_response(response_text, file_diff.filename)
@@ -153,7 +331,7 @@ class ReviewAgent:
             return ReviewResult(
                 file_path=file_diff.filename,
                 comments=comments,
-                summary=response_text[:200] if response_text else None,
+                summary=response_text[:200] or None,
             )
 
         except Exception as e:
@@ -187,41 +365,36 @@ class ReviewAgent:
         Returns:
             List of ReviewComment objects.
         """
-        comments: list[ReviewComment] = []
+        # isspace() avoids allocating a stripped copy of the response
+        if not response or response.isspace():
+            return []
 
         # For now, create a single summary comment with the full response
         # A more sophisticated implementation would parse structured output
-        if response.strip():
-            # Try to determine severity from response
-            severity = Severity.INFO
-            if "error" in response.lower() or "bug" in response.lower():
-                severity = Severity.WARNING
-            if "critical" in response.lower() or "security" in response.lower():
-                severity = Severity.ERROR
-            if "good" in response.lower() or "well done" in response.lower():
-                severity = Severity.PRAISE
-
-            # Determine category
-            category = Category.BEST_PRACTICE
-            if "security" in response.lower():
-                category = Category.SECURITY
-            elif "performance" in response.lower():
-                category = Category.PERFORMANCE
-            elif "bug" in response.lower():
-                category = Category.BUG
-            elif "style" in response.lower():
-                category = Category.STYLE
-
-            comments.append(
-                ReviewComment(
-                    body=response,
-                    comment_type=CommentType.SUMMARY,
-                    severity=severity,
-                    category=category,
-                )
-            )
+        found = {
+            match.group().lower() for match in _KEYWORD_RE.finditer(response, 0, _CLASSIFY_WINDOW)
+        }
+
+        # Try to determine severity from response
+        severity = Severity.INFO
+        for keywords, keyword_severity in _SEVERITY_KEYWORDS:
+            if not found.isdisjoint(keywords):
+                severity = keyword_severity
+
+        # Determine category
+        category = next(
+            (cat for keyword, cat in _CATEGORY_KEYWORDS if keyword in found),
+            Category.BEST_PRACTICE,
+        )
 
-        return comments
+        return [
+            ReviewComment(
+                body=response,
+                comment_type=CommentType.SUMMARY,
+                severity=severity,
+                category=category,
+            )
+        ]
 
     def create_summary(
         self,
@@ -263,8 +436,7 @@ class ReviewAgent:
         )
 
         try:
-            response = self.agent(prompt)
-            return str(response.message) if hasattr(response, "message") else str(response)
+            return self._invoke(prompt)
         except Exception as e:
             logger.error("Failed to create summary", extra={"error": str(e)})
             return f"Review completed for {len(file_results)} files."
@@ -9,19 +9,25 @@ ReviewBot as a Bedrock AgentCore agent. It handles:
 
 from __future__ import annotations
 
-import json
+import base64
+import binascii
+import dataclasses
+import functools
 import os
-from typing import Any
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from bedrock_agentcore.runtime import BedrockAgentCoreApp, PingStatus
-from strands import Agent
-from strands.models import BedrockModel
 
 from app.agent.prompts import build_system_prompt
 from app.agent.reviewer import ReviewAgent, ReviewResult
+from app.models.comment import Category, CommentType, ReviewComment, Severity
 from app.models.config import AgentConfig
 from app.models.file_diff import FileDiff
 from app.models.pull_request import PullRequest
+from app.tools.comments import post_comments
 from app.tools.github import (
     GitHubToolError,
     create_github_client,
@@ -29,8 +35,13 @@ from app.tools.github import (
     list_pr_files,
 )
 from app.utils.logging import configure_logging, get_logger
-from app.webhook.handler import WebhookHandler, WebhookParseError
-from app.webhook.validators import WebhookSignatureError, verify_webhook_signature
+from app.webhook.pipeline import process_webhook
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from strands import Agent
+    from strands.models import BedrockModel
 
 # Configure logging
 configure_logging()
@@ -39,27 +50,190 @@ logger = get_logger("agentcore")
 # Create AgentCore application
 app = BedrockAgentCoreApp()
 
+# Head SHA for PRs reviewed without GitHub access
+_ZERO_SHA = "0" * 40
+
+# System prompt for general-purpose agents (no custom rules), built once
+_DEFAULT_SYSTEM_PROMPT = build_system_prompt()
+
+# Review agents reused across invocations, keyed by everything that shapes them
+_AGENT_POOL: dict[tuple[Any, ...], ReviewAgent] = {}
+_AGENT_POOL_LOCK = threading.Lock()
+
+# Webhook-triggered reviews run here so GitHub gets its response long before
+# the review finishes (deliveries time out after 10 seconds and are retried)
+_REVIEW_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="review")
+
+# Recently queued delivery IDs, so redelivered webhooks don't review twice
+_SEEN_DELIVERIES_SIZE = 1024
+_SEEN_DELIVERIES: OrderedDict[str, None] = OrderedDict()
+_SEEN_DELIVERIES_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def _model_for(model_id: str, temperature: float) -> BedrockModel:
+    """Get the shared Bedrock model for a model ID and temperature.
+
+    Args:
+        model_id: Bedrock model ID.
+        temperature: Sampling temperature.
+
+    Returns:
+        BedrockModel for the given settings.
+    """
+    # Only /invocations queries need Strands here, so it stays out of the
+    # startup path until first used
+    from strands.models import BedrockModel  # noqa: PLC0415
+
+    return BedrockModel(model_id=model_id, temperature=temperature)
+
 
 def _create_general_agent() -> Agent:
     """Create a general-purpose conversational agent.
 
+    The underlying Bedrock model (and its boto3 client) is shared; the agent
+    itself is per-request so conversations never leak between callers.
+
     Returns:
         Strands Agent for general queries.
     """
-    model = BedrockModel(
-        model_id="anthropic.claude-sonnet-4-20250514-v1:0",
-        temperature=0.3,
-    )
+    from strands import Agent  # noqa: PLC0415
+
     return Agent(
-        model=model,
-        system_prompt=build_system_prompt(),
+        model=_model_for("anthropic.claude-sonnet-4-20250514-v1:0", 0.3),
+        system_prompt=_DEFAULT_SYSTEM_PROMPT,
+        callback_handler=None,
+    )
+
+
+async def _stream_general_response(prompt: str) -> AsyncIterator[str]:
+    """Stream a general query's answer as it is generated.
+
+    Args:
+        prompt: The user's message.
+
+    Yields:
+        Text chunks of the agent's response.
+    """
+    agent = _create_general_agent()
+    async for event in agent.stream_async(prompt):
+        text = event.get("data")
+        if text:
+            yield text
+
+
+def _get_review_agent(config: AgentConfig, custom_rules: str | None = None) -> ReviewAgent:
+    """Get a pooled review agent for a configuration, creating it on first use.
+
+    Args:
+        config: Agent configuration.
+        custom_rules: Optional custom rules from repository.
+
+    Returns:
+        ReviewAgent for the configuration.
+    """
+    # Every config field, since the agent keeps (and reads) its config
+    key = (
+        *(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(config, f.name) for f in dataclasses.fields(config))
+        ),
+        custom_rules,
     )
+    with _AGENT_POOL_LOCK:
+        agent = _AGENT_POOL.get(key)
+        if agent is None:
+            agent = _AGENT_POOL[key] = ReviewAgent(config=config, custom_rules=custom_rules)
+        return agent
+
+
+def _load_pull_request(
+    repository: str,
+    pr_number: int,
+    installation_id: int | None,
+    pull_request: PullRequest | None = None,
+) -> tuple[PullRequest, list[dict[str, Any]]]:
+    """Load a pull request and its changed files.
+
+    Args:
+        repository: Repository in owner/repo format.
+        pr_number: Pull request number.
+        installation_id: Optional GitHub App installation ID. Without it, a
+            minimal PR with no files is returned.
+        pull_request: Already-known PR details (e.g. from the webhook
+            payload). When given, only the file list is fetched.
+
+    Returns:
+        Tuple of (PullRequest, GitHub file dictionaries).
+    """
+    # The webhook payload already carries the PR metadata
+    if installation_id and pull_request is not None:
+        pr_files = list_pr_files(
+            create_github_client(installation_id),
+            pr_number,
+            repository,
+            head_sha=pull_request.head_sha,
+        )
+        return pull_request, pr_files
+
+    # If we have installation_id, use GitHub API to get PR details
+    if installation_id:
+        github_client = create_github_client(installation_id)
+
+        # File lists are cached per head commit, so the files are fetched for
+        # the head the metadata reports
+        pr_metadata = get_pr_metadata(github_client, pr_number, repository)
+        pr_files = list_pr_files(
+            github_client, pr_number, repository, head_sha=pr_metadata["head_sha"]
+        )
+
+        # Create PullRequest object
+        pr = PullRequest(
+            number=pr_number,
+            title=pr_metadata["title"],
+            body=pr_metadata.get("body"),
+            author=pr_metadata["author"],
+            base_branch=pr_metadata["base_branch"],
+            head_branch=pr_metadata["head_branch"],
+            head_sha=pr_metadata["head_sha"],
+            repository=repository,
+            installation_id=installation_id,
+            html_url=pr_metadata.get(
+                "html_url", f"https://github.com/{repository}/pull/{pr_number}"
+            ),
+            files_changed=pr_metadata.get("files_changed", len(pr_files)),
+            additions=pr_metadata.get("additions", 0),
+            deletions=pr_metadata.get("deletions", 0),
+        )
+    else:
+        # Create minimal PR object for review without GitHub API
+        pr = PullRequest(
+            number=pr_number,
+            title=f"PR #{pr_number}",
+            body=None,
+            author="unknown",
+            base_branch="main",
+            head_branch="feature",
+            head_sha=_ZERO_SHA,
+            repository=repository,
+            installation_id=1,  # Placeholder
+            html_url=f"https://github.com/{repository}/pull/{pr_number}",
+            files_changed=0,
+            additions=0,
+            deletions=0,
+        )
+        pr_files = []
+
+    return pr, pr_files
 
 
 def review_pr(
     repository: str,
     pr_number: int,
     installation_id: int | None = None,
+    pull_request: PullRequest | None = None,
+    *,
+    post_results: bool = False,
 ) -> dict[str, Any]:
     """Review a pull request.
 
@@ -67,6 +241,10 @@ def review_pr(
         repository: Repository in owner/repo format.
         pr_number: Pull request number.
         installation_id: Optional GitHub App installation ID.
+        pull_request: Optional PR details already known to the caller, which
+            spare the metadata request.
+        post_results: Whether to post the summary and inline comments to the
+            PR. Requires installation_id.
 
     Returns:
         Dictionary containing review results.
@@ -83,81 +261,110 @@ def review_pr(
         # Create agent config
         config = AgentConfig.default()
 
-        # If we have installation_id, use GitHub API to get PR details
-        if installation_id:
-            github_client = create_github_client(installation_id)
-            pr_metadata = get_pr_metadata(github_client, pr_number, repository)
-            pr_files = list_pr_files(github_client, pr_number, repository)
-
-            # Create PullRequest object
-            pr = PullRequest(
-                number=pr_number,
-                title=pr_metadata["title"],
-                body=pr_metadata.get("body"),
-                author=pr_metadata["author"],
-                base_branch=pr_metadata["base_branch"],
-                head_branch=pr_metadata["head_branch"],
-                head_sha="0" * 40,  # Placeholder - we don't have this from metadata
-                repository=repository,
-                installation_id=installation_id,
-                html_url=f"https://github.com/{repository}/pull/{pr_number}",
-                files_changed=pr_metadata.get("files_changed", len(pr_files)),
-                additions=pr_metadata.get("additions", 0),
-                deletions=pr_metadata.get("deletions", 0),
-            )
-
-            # Convert to FileDiff objects
-            file_diffs = [FileDiff.from_github_file(f) for f in pr_files]
-        else:
-            # Create minimal PR object for review without GitHub API
-            pr = PullRequest(
-                number=pr_number,
-                title=f"PR #{pr_number}",
-                body=None,
-                author="unknown",
-                base_branch="main",
-                head_branch="feature",
-                head_sha="0" * 40,
-                repository=repository,
-                installation_id=1,  # Placeholder
-                html_url=f"https://github.com/{repository}/pull/{pr_number}",
-                files_changed=0,
-                additions=0,
-                deletions=0,
-            )
-            file_diffs = []
-
-        # Create review agent
-        agent = ReviewAgent(config=config)
-
-        # Review each file
-        results: list[ReviewResult] = []
-        for file_diff in file_diffs:
-            result = agent.review_file(pr=pr, file_diff=file_diff)
-            results.append(result)
+        pr, pr_files = _load_pull_request(repository, pr_number, installation_id, pull_request)
+
+        # Get (or create) the review agent for this configuration
+        agent = _get_review_agent(config)
+
+        # Excluded files are reported as skipped without building a FileDiff
+        # or taking a slot in the review pool
+        match_excluded = config.excluded_matcher
+        results_by_index: dict[int, ReviewResult] = {}
+        pending: list[tuple[int, FileDiff]] = []
+        for idx, f in enumerate(pr_files):
+            pattern = match_excluded(f["filename"])
+            if pattern is None:
+                pending.append((idx, FileDiff.from_github_file(f)))
+            else:
+                results_by_index[idx] = ReviewResult(
+                    file_path=f["filename"],
+                    skipped=True,
+                    skip_reason=f"Matches exclusion pattern: {pattern}",
+                )
+
+        # Cap the number of Bedrock calls; the smallest files go first so the
+        # summary still covers as much of the PR as possible
+        files_skipped_due_to_limit = 0
+        max_files = config.max_files
+        if max_files and len(pending) > max_files:
+            pending.sort(key=lambda item: item[1].total_changes)
+            for idx, file_diff in pending[max_files:]:
+                results_by_index[idx] = ReviewResult(
+                    file_path=file_diff.filename,
+                    skipped=True,
+                    skip_reason=f"Exceeds max_files limit ({max_files})",
+                )
+            files_skipped_due_to_limit = len(pending) - max_files
+            del pending[max_files:]
+
+        # Review files concurrently; each review is an I/O-bound Bedrock call
+        reviewed: list[ReviewResult] = []
+        if pending:
+            max_workers = min(config.max_parallel, len(pending))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                reviewed = list(
+                    executor.map(
+                        lambda item: agent.review_file(pr=pr, file_diff=item[1]),
+                        pending,
+                    )
+                )
+
+        # Merge back into PR order
+        for (idx, _), result in zip(pending, reviewed, strict=True):
+            results_by_index[idx] = result
+        results = [results_by_index[idx] for idx in range(len(pr_files))]
 
         # Create summary
         summary = agent.create_summary(pr=pr, file_results=results)
 
-        # Compile response
-        files_reviewed = [
-            {
-                "file_path": r.file_path,
-                "skipped": r.skipped,
-                "skip_reason": r.skip_reason,
-                "comment_count": len(r.comments),
-            }
-            for r in results
-        ]
+        # Compile response in a single pass over the results
+        files_reviewed: list[dict[str, Any]] = []
+        files_skipped = 0
+        total_comments = 0
+        for r in results:
+            comment_count = len(r.comments)
+            files_reviewed.append(
+                {
+                    "file_path": r.file_path,
+                    "skipped": r.skipped,
+                    "skip_reason": r.skip_reason,
+                    "comment_count": comment_count,
+                }
+            )
+            files_skipped += r.skipped
+            total_comments += comment_count
 
-        return {
+        review = {
             "summary": summary,
             "files_reviewed": files_reviewed,
-            "total_files": len(file_diffs),
-            "files_skipped": sum(1 for r in results if r.skipped),
-            "total_comments": sum(len(r.comments) for r in results),
+            "total_files": len(pr_files),
+            "files_skipped": files_skipped,
+            "files_skipped_due_to_limit": files_skipped_due_to_limit,
+            "total_comments": total_comments,
         }
 
+        # The overall summary already covers each file's summary, so only it
+        # and the inline comments are posted
+        if post_results and installation_id:
+            comments = [
+                ReviewComment(
+                    body=summary,
+                    comment_type=CommentType.SUMMARY,
+                    severity=Severity.INFO,
+                    category=Category.BEST_PRACTICE,
+                ),
+                *(c for r in results for c in r.comments if c.is_inline),
+            ]
+            review["posting"] = post_comments(
+                client=create_github_client(installation_id),
+                pr_number=pr_number,
+                repository=repository,
+                comments=comments,
+                commit_id=pr.head_sha,
+            )
+
+        return review
+
     except GitHubToolError as e:
         logger.error("GitHub API error", extra={"error": str(e)})
         return {
@@ -166,6 +373,7 @@ def review_pr(
             "files_reviewed": [],
             "total_files": 0,
             "files_skipped": 0,
+            "files_skipped_due_to_limit": 0,
             "total_comments": 0,
         }
     except Exception as e:
@@ -176,17 +384,19 @@ def review_pr(
             "files_reviewed": [],
             "total_files": 0,
             "files_skipped": 0,
+            "files_skipped_due_to_limit": 0,
             "total_comments": 0,
         }
 
 
-def review_pr_from_model(pr: PullRequest) -> dict[str, Any]:
+def review_pr_from_model(pr: PullRequest, *, post_results: bool = False) -> dict[str, Any]:
     """Review a pull request using a PullRequest model object.
 
     This is used by the webhook handler when a PR event is received.
 
     Args:
         pr: The PullRequest model object.
+        post_results: Whether to post the review to the PR.
 
     Returns:
         Dictionary containing review results.
@@ -195,139 +405,277 @@ def review_pr_from_model(pr: PullRequest) -> dict[str, Any]:
         repository=pr.repository,
         pr_number=pr.number,
         installation_id=pr.installation_id,
+        pull_request=pr,
+        post_results=post_results,
     )
 
 
-def handle_webhook(  # noqa: PLR0911
-    body: bytes,
-    signature: str,
-    event_type: str,
-    delivery_id: str,
-) -> dict[str, Any]:
-    """Handle a GitHub webhook request.
+def _mark_delivery_seen(delivery_id: str) -> bool:
+    """Record a webhook delivery ID.
 
     Args:
-        body: Raw request body bytes.
-        signature: X-Hub-Signature-256 header value.
-        event_type: X-GitHub-Event header value.
         delivery_id: X-GitHub-Delivery header value.
 
     Returns:
-        Dictionary containing response data.
+        True if the delivery is new, False if it was already recorded.
     """
-    logger.info(
-        "Received webhook",
-        extra={
-            "event_type": event_type,
-            "delivery_id": delivery_id,
-        },
-    )
+    with _SEEN_DELIVERIES_LOCK:
+        if delivery_id in _SEEN_DELIVERIES:
+            return False
+        _SEEN_DELIVERIES[delivery_id] = None
+        if len(_SEEN_DELIVERIES) > _SEEN_DELIVERIES_SIZE:
+            _SEEN_DELIVERIES.popitem(last=False)
+        return True
 
-    # Get webhook secret from environment
-    webhook_secret = os.environ.get("GITHUB_WEBHOOK_SECRET", "")
-    if not webhook_secret:
-        logger.error("GITHUB_WEBHOOK_SECRET not configured")
-        return {
-            "status_code": 500,
-            "error": "configuration_error",
-            "message": "Webhook secret not configured",
-        }
 
-    # Verify signature
-    try:
-        verify_webhook_signature(body, signature, webhook_secret)
-    except WebhookSignatureError as e:
-        logger.warning("Signature verification failed", extra={"error": str(e)})
-        return {
-            "status_code": 403,
-            "error": "invalid_signature",
-            "message": str(e),
-        }
+def _forget_delivery(delivery_id: str) -> None:
+    """Drop a delivery ID so a redelivery of it is processed again.
 
-    # Parse JSON payload
-    try:
-        payload = json.loads(body)
-    except json.JSONDecodeError as e:
-        logger.warning("Invalid JSON payload", extra={"error": str(e)})
-        return {
-            "status_code": 400,
-            "error": "invalid_payload",
-            "message": f"Invalid JSON: {e}",
-        }
+    Args:
+        delivery_id: X-GitHub-Delivery header value.
+    """
+    with _SEEN_DELIVERIES_LOCK:
+        _SEEN_DELIVERIES.pop(delivery_id, None)
+
+
+def _run_background_review(pr: PullRequest, delivery_id: str) -> None:
+    """Review a pull request on the background executor.
 
-    # Dispatch event
-    handler = WebhookHandler()
+    The task is registered with the AgentCore app so the runtime reports the
+    session as busy until the review completes. Nobody waits for the result,
+    so it is posted to the pull request.
 
+    Args:
+        pr: The PullRequest model object.
+        delivery_id: X-GitHub-Delivery header value.
+    """
+    task_id = app.add_async_task("review_pr", {"delivery_id": delivery_id})
     try:
-        result = handler.dispatch(event_type, payload)
-    except WebhookParseError as e:
-        logger.warning("Failed to parse webhook", extra={"error": str(e)})
-        return {
-            "status_code": 400,
-            "error": "invalid_payload",
-            "message": str(e),
+        review_result = review_pr_from_model(pr, post_results=True)
+        errors = review_result.get("posting", {}).get("errors", [])
+        if "error" in review_result:
+            errors = [review_result["error"], *errors]
+        extra = {
+            "delivery_id": delivery_id,
+            "repository": pr.repository,
+            "pr_number": pr.number,
         }
+        if errors:
+            logger.error("Background review failed", extra={**extra, "errors": errors})
+        else:
+            logger.info(
+                "Background review finished",
+                extra={**extra, "total_comments": review_result["total_comments"]},
+            )
+    except Exception as e:
+        logger.error(
+            "Background review failed",
+            extra={"delivery_id": delivery_id, "error": str(e)},
+        )
+    finally:
+        app.complete_async_task(task_id)
+
+
+def _reply_pull_request(
+    result: dict[str, Any],
+    event_type: str,  # noqa: ARG001
+    delivery_id: str,
+) -> dict[str, Any]:
+    """Build the webhook response for a dispatched pull_request event.
+
+    Queues a background review when the action calls for one.
 
-    # Handle based on result
-    # Check for parse errors first (applies to PR events with missing fields)
-    if result.get("event_type") == "pull_request" and "error" in result:
+    Args:
+        result: Result of WebhookHandler.dispatch.
+        event_type: X-GitHub-Event header value.
+        delivery_id: X-GitHub-Delivery header value.
+
+    Returns:
+        Dictionary containing response data.
+    """
+    # Parse errors (missing fields) are reported before anything else
+    if "error" in result:
         return {
             "status_code": 400,
             "error": "invalid_payload",
             "message": result["error"],
         }
 
-    if result.get("should_review") and "pull_request" in result:
-        pr = result["pull_request"]
-
-        try:
-            review_result = review_pr_from_model(pr)
-            return {
-                "status_code": 202,
-                "status": "queued",
-                "message": f"Review queued for PR #{pr.number}",
-                "review": review_result,
-            }
-        except Exception as e:
-            logger.error("Failed to trigger review", extra={"error": str(e)})
-            return {
-                "status_code": 500,
-                "error": "internal_error",
-                "message": "Failed to queue review",
-            }
-
-    elif result.get("event_type") == "ping":
+    pr = result.get("pull_request")
+    if not result.get("should_review") or pr is None:
+        # PR event that doesn't need review (closed, etc.)
         return {
             "status_code": 200,
-            "status": "ok",
-            "message": f"Pong! {result.get('zen', '')}",
+            "status": "ignored",
+            "message": f"Action '{result.get('action', '')}' does not trigger review",
         }
 
-    elif result.get("event_type") == "installation":
+    if delivery_id and not _mark_delivery_seen(delivery_id):
+        logger.info("Duplicate delivery ignored", extra={"delivery_id": delivery_id})
         return {
             "status_code": 200,
-            "status": "ok",
-            "message": f"Installation event processed: {result.get('action', '')}",
+            "status": "duplicate",
+            "message": f"Delivery {delivery_id} already queued",
         }
 
-    elif result.get("status") == "ignored":
+    try:
+        _REVIEW_EXECUTOR.submit(_run_background_review, pr, delivery_id)
+    except Exception as e:
+        _forget_delivery(delivery_id)
+        logger.error("Failed to trigger review", extra={"error": str(e)})
         return {
-            "status_code": 200,
-            "status": "ignored",
-            "message": f"Event type '{event_type}' not handled",
+            "status_code": 500,
+            "error": "internal_error",
+            "message": "Failed to queue review",
         }
 
-    else:
-        # PR event that doesn't need review (closed, etc.)
-        return {
-            "status_code": 200,
-            "status": "ignored",
-            "message": f"Action '{result.get('action', '')}' does not trigger review",
-        }
+    return {
+        "status_code": 202,
+        "status": "queued",
+        "message": f"Review queued for PR #{pr.number}",
+    }
+
+
+def _reply_ping(
+    result: dict[str, Any],
+    event_type: str,  # noqa: ARG001
+    delivery_id: str,  # noqa: ARG001
+) -> dict[str, Any]:
+    """Build the webhook response for a ping event.
+
+    Args:
+        result: Result of WebhookHandler.dispatch.
+        event_type: X-GitHub-Event header value.
+        delivery_id: X-GitHub-Delivery header value.
+
+    Returns:
+        Dictionary containing response data.
+    """
+    return {
+        "status_code": 200,
+        "status": "ok",
+        "message": f"Pong! {result.get('zen', '')}",
+    }
+
+
+def _reply_installation(
+    result: dict[str, Any],
+    event_type: str,  # noqa: ARG001
+    delivery_id: str,  # noqa: ARG001
+) -> dict[str, Any]:
+    """Build the webhook response for an installation event.
+
+    Args:
+        result: Result of WebhookHandler.dispatch.
+        event_type: X-GitHub-Event header value.
+        delivery_id: X-GitHub-Delivery header value.
+
+    Returns:
+        Dictionary containing response data.
+    """
+    return {
+        "status_code": 200,
+        "status": "ok",
+        "message": f"Installation event processed: {result.get('action', '')}",
+    }
+
+
+def _reply_ignored(
+    result: dict[str, Any],  # noqa: ARG001
+    event_type: str,
+    delivery_id: str,  # noqa: ARG001
+) -> dict[str, Any]:
+    """Build the webhook response for an event type without a handler.
+
+    Args:
+        result: Result of WebhookHandler.dispatch.
+        event_type: X-GitHub-Event header value.
+        delivery_id: X-GitHub-Delivery header value.
+
+    Returns:
+        Dictionary containing response data.
+    """
+    return {
+        "status_code": 200,
+        "status": "ignored",
+        "message": f"Event type '{event_type}' not handled",
+    }
+
+
+# Webhook responses by dispatched event type; anything else is ignored
+_WEBHOOK_REPLIES: dict[str, Callable[[dict[str, Any], str, str], dict[str, Any]]] = {
+    "pull_request": _reply_pull_request,
+    "ping": _reply_ping,
+    "installation": _reply_installation,
+}
+
+
+def handle_webhook(
+    body: bytes,
+    signature: str,
+    event_type: str,
+    delivery_id: str,
+    body_text: str | None = None,
+) -> dict[str, Any]:
+    """Handle a GitHub webhook request.
+
+    Args:
+        body: Raw request body bytes.
+        signature: X-Hub-Signature-256 header value.
+        event_type: X-GitHub-Event header value.
+        delivery_id: X-GitHub-Delivery header value.
+        body_text: Optional already-decoded body. When given, it is parsed
+            directly instead of decoding ``body`` a second time.
+
+    Returns:
+        Dictionary containing response data.
+    """
+    logger.info(
+        "Received webhook",
+        extra={
+            "event_type": event_type,
+            "delivery_id": delivery_id,
+        },
+    )
+
+    status_code, result = process_webhook(
+        body,
+        signature,
+        event_type,
+        delivery_id,
+        os.environ.get("GITHUB_WEBHOOK_SECRET", ""),
+        body_text=body_text,
+    )
+    if status_code != 200:
+        return {"status_code": status_code, **result}
+
+    reply = _WEBHOOK_REPLIES.get(result.get("event_type", ""), _reply_ignored)
+    return reply(result, event_type, delivery_id)
+
+
+def _normalize_body(payload: dict[str, Any]) -> tuple[bytes, str | None]:
+    """Get the raw webhook body from an invocation payload.
+
+    Args:
+        payload: Invocation payload carrying ``webhook_body``.
+
+    Returns:
+        Tuple of (body bytes, body text). The text is only set when the body
+        arrived as plain text, so JSON parsing can skip decoding the bytes.
+
+    Raises:
+        binascii.Error: If a base64-encoded body is malformed.
+    """
+    body = payload["webhook_body"]
+    if payload.get("webhook_is_base64_encoded"):
+        return base64.b64decode(body, validate=True), None
+    if isinstance(body, str):
+        return body.encode(), body
+    return body, None
 
 
 @app.entrypoint
-def invoke(payload: dict[str, Any]) -> dict[str, Any]:
+def invoke(payload: dict[str, Any]) -> dict[str, Any] | AsyncIterator[str]:
     """Main entrypoint for AgentCore invocations.
 
     This function handles incoming requests to the agent. It supports:
@@ -345,21 +693,35 @@ def invoke(payload: dict[str, Any]) -> dict[str, Any]:
             - webhook_signature: (optional) X-Hub-Signature-256 header
             - webhook_event_type: (optional) X-GitHub-Event header
             - webhook_delivery_id: (optional) X-GitHub-Delivery header
+            - webhook_is_base64_encoded: (optional) True if webhook_body is
+              base64-encoded, as API Gateway does for binary payloads
+            - stream: (optional) True to stream a general query's answer
 
     Returns:
         Dictionary containing:
             - result: The agent's response or review summary
             - Additional fields depending on request type
+        or, for streamed general queries, an async iterator of text chunks
+        that AgentCore sends as server-sent events.
     """
     # Check if this is a webhook request
     webhook_body = payload.get("webhook_body")
     if webhook_body:
-        body_bytes = webhook_body.encode() if isinstance(webhook_body, str) else webhook_body
+        try:
+            body_bytes, body_text = _normalize_body(payload)
+        except binascii.Error as e:
+            logger.warning("Invalid base64 webhook body", extra={"error": str(e)})
+            return {
+                "status_code": 400,
+                "error": "invalid_payload",
+                "message": f"Invalid base64 body: {e}",
+            }
         return handle_webhook(
             body=body_bytes,
             signature=payload.get("webhook_signature", ""),
             event_type=payload.get("webhook_event_type", ""),
             delivery_id=payload.get("webhook_delivery_id", ""),
+            body_text=body_text,
         )
 
     prompt = payload.get("prompt", "Hello! How can I help you with code review?")
@@ -390,6 +752,9 @@ def invoke(payload: dict[str, Any]) -> dict[str, Any]:
             }
 
         # Otherwise, handle as a general query
+        if payload.get("stream") is True:
+            return _stream_general_response(prompt)
+
         agent = _create_general_agent()
         response = agent(prompt)
         response_text = str(response.message) if hasattr(response, "message") else str(response)
@@ -411,6 +776,8 @@ def ping() -> PingStatus:
     Returns:
         PingStatus indicating the agent's health.
     """
+    if app.get_async_task_info()["active_count"]:
+        return PingStatus.HEALTHY_BUSY
     return PingStatus.HEALTHY
 
 
@@ -40,7 +40,17 @@ class LineSide(str, Enum):
     RIGHT = "RIGHT"  # Added line (head)
 
 
-@dataclass
+# Metadata prefix pieces for formatted comments
+_SEVERITY_EMOJI: dict[Severity, str] = {
+    Severity.ERROR: ":x:",
+    Severity.WARNING: ":warning:",
+    Severity.INFO: ":information_source:",
+    Severity.PRAISE: ":star:",
+}
+_SEVERITY_LABEL: dict[Severity, str] = {severity: severity.value.upper() for severity in Severity}
+
+
+@dataclass(slots=True)
 class ReviewComment:
     """A comment to be posted on the pull request."""
 
@@ -57,7 +67,10 @@ class ReviewComment:
         if not self.body:
             raise ValueError("Comment body cannot be empty")
 
-        if self.comment_type == CommentType.INLINE:
+        # Normalize to the enum member so type checks can compare by identity
+        self.comment_type = CommentType(self.comment_type)
+
+        if self.comment_type is CommentType.INLINE:
             if not self.file_path:
                 raise ValueError("Inline comments require file_path")
             if not self.line:
@@ -72,7 +85,7 @@ class ReviewComment:
     @property
     def is_inline(self) -> bool:
         """Check if this is an inline comment."""
-        return self.comment_type == CommentType.INLINE
+        return self.comment_type is CommentType.INLINE
 
     def to_github_review_comment(self) -> dict[str, Any]:
         """Convert to GitHub API format for review comments.
@@ -101,12 +114,8 @@ class ReviewComment:
         Returns:
             Formatted comment body with metadata prefix.
         """
-        severity_emoji = {
-            Severity.ERROR: ":x:",
-            Severity.WARNING: ":warning:",
-            Severity.INFO: ":information_source:",
-            Severity.PRAISE: ":star:",
-        }
-
-        emoji = severity_emoji.get(self.severity, "")
-        return f"{emoji} **{self.severity.value.upper()}** ({self.category.value}): {self.body}"
+        severity = self.severity
+        return (
+            f"{_SEVERITY_EMOJI.get(severity, '')} **{_SEVERITY_LABEL[severity]}** "
+            f"({self.category.value}): {self.body}"
+        )
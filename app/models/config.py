@@ -1,18 +1,26 @@
 """Configuration models for reviewbot."""
 
+import fnmatch
+import functools
+import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 # Supported Bedrock model IDs
-SUPPORTED_MODELS = {
-    "anthropic.claude-sonnet-4-20250514-v1:0",
-    "anthropic.claude-haiku-4-20251015-v1:0",
-    "amazon.nova-pro-v1:0",
-    "amazon.nova-lite-v1:0",
-}
+SUPPORTED_MODELS = frozenset(
+    {
+        "anthropic.claude-sonnet-4-20250514-v1:0",
+        "anthropic.claude-haiku-4-20251015-v1:0",
+        "amazon.nova-pro-v1:0",
+        "amazon.nova-lite-v1:0",
+    }
+)
 
 # Default patterns to exclude from review
-DEFAULT_EXCLUDED = [
+DEFAULT_EXCLUDED: tuple[str, ...] = (
     "*.lock",
     "*.min.js",
     "*.min.css",
@@ -20,10 +28,73 @@ DEFAULT_EXCLUDED = [
     "node_modules/**",
     "dist/**",
     "build/**",
-]
+)
+
+# .reviewbot.yml keys and the AgentConfig fields they set
+_REPO_CONFIG_FIELDS = {
+    "model": "model_id",
+    "timeout": "timeout_seconds",
+    "temperature": "temperature",
+    "max_files": "max_files",
+    "max_parallel": "max_parallel",
+    "min_review_changes": "min_review_changes",
+    "enable_rereview": "enable_rereview",
+    "rules_path": "rules_path",
+    "excluded_patterns": "excluded_patterns",
+}
 
 
-@dataclass
+@functools.lru_cache(maxsize=32)
+def _compile_exclusions(patterns: tuple[str, ...]) -> Callable[[str], str | None]:
+    """Compile exclusion glob patterns into a single matcher.
+
+    Plain extension patterns ("*.lock", "*.min.js") are checked with one
+    str.endswith; the remaining globs are compiled into one alternation, each
+    in a named group so a match reports which pattern fired.
+
+    Args:
+        patterns: Glob patterns, as in AgentConfig.excluded_patterns.
+
+    Returns:
+        Function mapping a file path to the first matching pattern, or None.
+    """
+    suffixes: dict[str, str] = {}
+    globs: list[str] = []
+    for pattern in patterns:
+        suffix = pattern[1:]
+        if (
+            pattern.startswith("*.")
+            and "/" not in suffix
+            and not any(char in suffix for char in "*?[")
+        ):
+            suffixes.setdefault(suffix, pattern)
+        else:
+            globs.append(pattern)
+
+    suffix_tuple = tuple(suffixes)
+    glob_re = (
+        re.compile(
+            "|".join(
+                f"(?P<p{idx}>{fnmatch.translate(pattern)})" for idx, pattern in enumerate(globs)
+            )
+        )
+        if globs
+        else None
+    )
+
+    def match(path: str) -> str | None:
+        if path.endswith(suffix_tuple):
+            return next(pattern for suffix, pattern in suffixes.items() if path.endswith(suffix))
+        if glob_re is not None:
+            found = glob_re.match(path)
+            if found and found.lastgroup:
+                return globs[int(found.lastgroup[1:])]
+        return None
+
+    return match
+
+
+@dataclass(slots=True)
 class Installation:
     """Represents a GitHub App installation."""
 
@@ -59,7 +130,7 @@ class Installation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration for the review agent."""
 
@@ -67,9 +138,11 @@ class AgentConfig:
     timeout_seconds: int = 600
     temperature: float = 0.3
     max_files: int | None = None
+    max_parallel: int = 8
+    min_review_changes: int = 2
     enable_rereview: bool = True
     rules_path: str = ".claude/rules"
-    excluded_patterns: list[str] = field(default_factory=lambda: DEFAULT_EXCLUDED.copy())
+    excluded_patterns: list[str] = field(default_factory=lambda: list(DEFAULT_EXCLUDED))
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
@@ -87,6 +160,33 @@ class AgentConfig:
         if not 0.0 <= self.temperature <= 1.0:
             raise ValueError(f"temperature must be between 0.0 and 1.0, got {self.temperature}")
 
+        if self.max_parallel < 1:
+            raise ValueError(f"max_parallel must be at least 1, got {self.max_parallel}")
+
+        if self.min_review_changes < 0:
+            raise ValueError(
+                f"min_review_changes must be non-negative, got {self.min_review_changes}"
+            )
+
+    @property
+    def excluded_matcher(self) -> Callable[[str], str | None]:
+        """Matcher reporting which exclusion pattern, if any, a path matches.
+
+        Compiled once per distinct pattern list and shared between configs.
+        """
+        return _compile_exclusions(tuple(self.excluded_patterns))
+
+    def is_excluded(self, path: str) -> bool:
+        """Check if a file path matches any exclusion pattern.
+
+        Args:
+            path: File path relative to the repository root.
+
+        Returns:
+            True if the file should not be reviewed.
+        """
+        return self.excluded_matcher(path) is not None
+
     @classmethod
     def from_repo_config(cls, config: dict[str, Any]) -> AgentConfig:
         """Load configuration from repository config file.
@@ -97,14 +197,13 @@ class AgentConfig:
         Returns:
             AgentConfig instance.
         """
+        # Missing keys fall through to the field defaults
         return cls(
-            model_id=config.get("model", cls.model_id),
-            timeout_seconds=config.get("timeout", cls.timeout_seconds),
-            temperature=config.get("temperature", cls.temperature),
-            max_files=config.get("max_files"),
-            enable_rereview=config.get("enable_rereview", cls.enable_rereview),
-            rules_path=config.get("rules_path", cls.rules_path),
-            excluded_patterns=config.get("excluded_patterns", DEFAULT_EXCLUDED.copy()),
+            **{
+                field_name: config[key]
+                for key, field_name in _REPO_CONFIG_FIELDS.items()
+                if key in config
+            }
         )
 
     @classmethod
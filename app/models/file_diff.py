@@ -1,6 +1,7 @@
 """File diff model."""
 
-from dataclasses import dataclass
+import posixpath
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -17,7 +18,7 @@ class FileStatus(str, Enum):
     UNCHANGED = "unchanged"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDiff:
     """Represents a single file's changes in a pull request."""
 
@@ -29,6 +30,9 @@ class FileDiff:
     patch: str | None = None
     previous_filename: str | None = None
 
+    # Lowercased extension without the dot ("" if none), derived from filename
+    file_extension: str = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Validate fields after initialization."""
         if not self.filename:
@@ -40,6 +44,12 @@ class FileDiff:
         if self.deletions < 0:
             raise ValueError(f"deletions must be non-negative, got {self.deletions}")
 
+        # Normalize raw strings so status can be compared by identity
+        self.status = FileStatus(self.status)
+
+        # GitHub paths are always POSIX, whatever the host platform
+        self.file_extension = posixpath.splitext(self.filename)[1][1:].lower()
+
     @property
     def is_binary(self) -> bool:
         """Check if file appears to be binary (no patch available).
@@ -47,20 +57,13 @@ class FileDiff:
         Binary files don't have patch content in GitHub's API.
         Removed files also have no patch, but aren't binary.
         """
-        return self.patch is None and self.status != FileStatus.REMOVED
+        return self.patch is None and self.status is not FileStatus.REMOVED
 
     @property
     def total_changes(self) -> int:
         """Total lines changed (added + deleted)."""
         return self.additions + self.deletions
 
-    @property
-    def file_extension(self) -> str:
-        """Get the file extension."""
-        if "." in self.filename:
-            return self.filename.rsplit(".", 1)[-1].lower()
-        return ""
-
     @classmethod
     def from_github_file(cls, file: dict[str, Any]) -> FileDiff:
         """Create a FileDiff from a GitHub API file response.
@@ -1,11 +1,42 @@
 """Pull request model."""
 
+import functools
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+# Validation patterns
+_REPO_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+$")
+_SHA_LENGTH = 40
+_HEX_DIGITS = frozenset("0123456789abcdef")
 
-@dataclass
+
+@functools.lru_cache(maxsize=1024)
+def _is_valid_repository(repository: str) -> bool:
+    """Check an owner/repo name; the same few repositories recur across PRs.
+
+    Args:
+        repository: Repository full name.
+
+    Returns:
+        True if the name has the owner/repo format.
+    """
+    return _REPO_PATTERN.match(repository) is not None
+
+
+def _is_valid_sha(sha: str) -> bool:
+    """Check that a commit SHA is 40 lowercase hex characters.
+
+    Args:
+        sha: Commit SHA.
+
+    Returns:
+        True if the SHA is well-formed.
+    """
+    return len(sha) == _SHA_LENGTH and _HEX_DIGITS.issuperset(sha)
+
+
+@dataclass(slots=True)
 class PullRequest:
     """Represents a GitHub pull request being reviewed."""
 
@@ -23,21 +54,21 @@ class PullRequest:
     deletions: int
     body: str | None = None
 
-    # Validation patterns
-    REPO_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_.-]+$")
-    SHA_PATTERN = re.compile(r"^[a-f0-9]{40}$")
+    # Owner and repository name, split from repository once after validation
+    _owner: str = field(init=False, repr=False, compare=False)
+    _repo_name: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate fields after initialization."""
         if self.number <= 0:
             raise ValueError(f"PR number must be positive, got {self.number}")
 
-        if not self.REPO_PATTERN.match(self.repository):
+        if not _is_valid_repository(self.repository):
             raise ValueError(
                 f"Invalid repository format: {self.repository}. Expected format: owner/repo"
             )
 
-        if not self.SHA_PATTERN.match(self.head_sha):
+        if not _is_valid_sha(self.head_sha):
             raise ValueError(
                 f"Invalid SHA format: {self.head_sha}. Expected 40-character hex string"
             )
@@ -45,6 +76,8 @@ class PullRequest:
         if self.installation_id <= 0:
             raise ValueError(f"Installation ID must be positive, got {self.installation_id}")
 
+        self._owner, self._repo_name = self.repository.split("/")
+
     @classmethod
     def from_webhook_payload(cls, payload: dict[str, Any]) -> PullRequest:
         """Create a PullRequest from a GitHub webhook payload.
@@ -79,12 +112,12 @@ class PullRequest:
     @property
     def owner(self) -> str:
         """Get the repository owner."""
-        return self.repository.split("/")[0]
+        return self._owner
 
     @property
     def repo_name(self) -> str:
         """Get the repository name without owner."""
-        return self.repository.split("/")[1]
+        return self._repo_name
 
     @property
     def total_changes(self) -> int:
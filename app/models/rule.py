@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewRule:
     """A custom rule loaded from .claude/rules/*.md."""
 
@@ -34,12 +34,12 @@ class ReviewRule:
         Returns:
             Title extracted from content, or filename without extension.
         """
-        lines = self.content.strip().split("\n")
-        first_line = lines[0].strip() if lines else ""
+        # Only the first line matters, so don't split the whole document
+        first_line = self.content.lstrip().partition("\n")[0].strip()
 
         if first_line.startswith("#"):
             # Remove # prefix and whitespace
             return first_line.lstrip("#").strip()
 
         # Fall back to filename without extension
-        return self.source_file.rsplit(".", 1)[0]
+        return self.source_file.rpartition(".")[0]
@@ -21,19 +21,30 @@ class ReviewState(str, Enum):
     FAILED = "failed"
 
 
-# Valid state transitions
-VALID_TRANSITIONS: dict[ReviewState, set[ReviewState]] = {
-    ReviewState.PENDING: {ReviewState.LOADING, ReviewState.FAILED},
-    ReviewState.LOADING: {ReviewState.REVIEWING, ReviewState.FAILED},
-    ReviewState.REVIEWING: {ReviewState.POSTING, ReviewState.FAILED},
-    ReviewState.POSTING: {ReviewState.COMPLETED, ReviewState.FAILED},
+# Valid state transitions (immutable, shared by every session)
+VALID_TRANSITIONS: dict[ReviewState, frozenset[ReviewState]] = {
+    ReviewState.PENDING: frozenset({ReviewState.LOADING, ReviewState.FAILED}),
+    ReviewState.LOADING: frozenset({ReviewState.REVIEWING, ReviewState.FAILED}),
+    ReviewState.REVIEWING: frozenset({ReviewState.POSTING, ReviewState.FAILED}),
+    ReviewState.POSTING: frozenset({ReviewState.COMPLETED, ReviewState.FAILED}),
     # Terminal states have no valid transitions
-    ReviewState.COMPLETED: set(),
-    ReviewState.FAILED: set(),
+    ReviewState.COMPLETED: frozenset(),
+    ReviewState.FAILED: frozenset(),
 }
 
+# Each state as a bit, and each state's valid next states as a bitmask, so
+# validating a transition is a single integer test
+_STATE_BIT: dict[ReviewState, int] = {state: 1 << i for i, state in enumerate(ReviewState)}
+_TRANSITION_MASKS: dict[ReviewState, int] = {
+    state: sum(_STATE_BIT[next_state] for next_state in next_states)
+    for state, next_states in VALID_TRANSITIONS.items()
+}
+
+# States a session never leaves
+_TERMINAL_STATES: frozenset[ReviewState] = frozenset({ReviewState.COMPLETED, ReviewState.FAILED})
 
-@dataclass
+
+@dataclass(slots=True)
 class ReviewSession:
     """Tracks the state of a review session.
 
@@ -58,9 +69,8 @@ class ReviewSession:
         Raises:
             ValueError: If the transition is invalid.
         """
-        valid_next_states = VALID_TRANSITIONS.get(self.state, set())
-
-        if new_state not in valid_next_states:
+        if not _TRANSITION_MASKS[self.state] & _STATE_BIT[new_state]:
+            valid_next_states = VALID_TRANSITIONS[self.state]
             raise ValueError(
                 f"Invalid transition: {self.state.value} -> {new_state.value}. "
                 f"Valid transitions: {[s.value for s in valid_next_states]}"
@@ -69,7 +79,7 @@ class ReviewSession:
         self.state = new_state
 
         # Set completion time for terminal states
-        if new_state in {ReviewState.COMPLETED, ReviewState.FAILED}:
+        if new_state in _TERMINAL_STATES:
             self.completed_at = datetime.now(UTC)
 
     def fail(self, error: str) -> None:
@@ -80,14 +90,14 @@ class ReviewSession:
         """
         self.error = error
         # Allow failing from any non-terminal state
-        if self.state not in {ReviewState.COMPLETED, ReviewState.FAILED}:
+        if self.state not in _TERMINAL_STATES:
             self.state = ReviewState.FAILED
             self.completed_at = datetime.now(UTC)
 
     @property
     def is_terminal(self) -> bool:
         """Check if session is in a terminal state."""
-        return self.state in {ReviewState.COMPLETED, ReviewState.FAILED}
+        return self.state in _TERMINAL_STATES
 
     @property
     def duration_seconds(self) -> float | None:
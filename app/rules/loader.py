@@ -1,12 +1,64 @@
 """Custom rules loader from .claude/rules/*.md files."""
 
-from pathlib import Path  # noqa: TC003
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from app.models.rule import ReviewRule
 from app.utils.logging import get_logger
 
 logger = get_logger("rules.loader")
 
+# Loaded rules keyed by (path, size, mtime_ns, priority), so unchanged files
+# are neither re-read nor re-validated when the same rules load repeatedly
+_RULE_CACHE_SIZE = 256
+_rule_cache: OrderedDict[tuple[str, int, int, int], ReviewRule] = OrderedDict()
+_rule_cache_lock = threading.Lock()
+
+
+# Upper bound on concurrent rule file reads; reads overlap I/O latency on
+# cold caches and network filesystems
+_MAX_READ_WORKERS = 8
+
+
+def clear_rule_cache() -> None:
+    """Drop all cached rules."""
+    with _rule_cache_lock:
+        _rule_cache.clear()
+
+
+def _read_rule_file(filepath: Path) -> str | OSError | ValueError:
+    """Read a rule file, returning the error instead of raising it.
+
+    Args:
+        filepath: Path to the rule file.
+
+    Returns:
+        The file content, or the error that prevented reading it.
+    """
+    try:
+        return filepath.read_text(encoding="utf-8")
+    except (OSError, ValueError) as e:
+        return e
+
+
+def _read_rule_files(filepaths: list[Path]) -> list[str | OSError | ValueError]:
+    """Read rule files concurrently, preserving order.
+
+    Args:
+        filepaths: Paths to read.
+
+    Returns:
+        Content (or read error) for each path, in the same order.
+    """
+    if len(filepaths) <= 1:
+        return [_read_rule_file(filepath) for filepath in filepaths]
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(filepaths))) as executor:
+        return list(executor.map(_read_rule_file, filepaths))
+
 
 class RuleLoaderError(Exception):
     """Error raised when rule loading fails."""
@@ -37,53 +89,54 @@ class RuleLoader:
             )
             return []
 
-        rules: list[ReviewRule] = []
-        files = sorted(rules_dir.glob("*.md"))
+        # scandir yields names and file types straight from the directory
+        # listing, so only regular .md files cost a stat (for the cache key)
+        with os.scandir(rules_dir) as it:
+            entries = sorted((e for e in it if e.name.endswith(".md")), key=lambda e: e.name)
+
+        rules_by_priority: dict[int, ReviewRule] = {}
+        pending: list[tuple[int, Path, tuple[str, int, int, int]]] = []
 
-        for idx, filepath in enumerate(files):
+        for idx, entry in enumerate(entries):
             try:
-                if not filepath.is_file():
+                if not entry.is_file():
                     logger.warning(
                         "Skipping non-file entry",
-                        extra={"path": str(filepath)},
-                    )
-                    continue
-
-                content = filepath.read_text(encoding="utf-8")
-
-                if not content.strip():
-                    logger.warning(
-                        "Skipping empty rule file",
-                        extra={"path": str(filepath)},
+                        extra={"path": entry.path},
                     )
                     continue
-
-                rule = ReviewRule(
-                    source_file=filepath.name,
-                    content=content,
-                    priority=idx,
-                )
-                rules.append(rule)
-
-                logger.debug(
-                    "Loaded rule",
-                    extra={
-                        "file": filepath.name,
-                        "priority": idx,
-                        "content_length": len(content),
-                    },
-                )
-
+                file_stat = entry.stat()
             except OSError as e:
                 logger.warning(
                     "Failed to read rule file",
-                    extra={"path": str(filepath), "error": str(e)},
-                )
-            except ValueError as e:
-                logger.warning(
-                    "Invalid rule file",
-                    extra={"path": str(filepath), "error": str(e)},
+                    extra={"path": entry.path, "error": str(e)},
                 )
+                continue
+
+            key = (entry.path, file_stat.st_size, file_stat.st_mtime_ns, idx)
+            with _rule_cache_lock:
+                cached = _rule_cache.get(key)
+                if cached is not None:
+                    _rule_cache.move_to_end(key)
+            if cached is not None:
+                rules_by_priority[idx] = cached
+            else:
+                pending.append((idx, Path(entry.path), key))
+
+        contents = _read_rule_files([filepath for _, filepath, _ in pending])
+
+        for (idx, filepath, key), content in zip(pending, contents, strict=True):
+            rule = self._build_rule(filepath, idx, content)
+            if rule is None:
+                continue
+
+            rules_by_priority[idx] = rule
+            with _rule_cache_lock:
+                _rule_cache[key] = rule
+                if len(_rule_cache) > _RULE_CACHE_SIZE:
+                    _rule_cache.popitem(last=False)
+
+        rules = [rules_by_priority[idx] for idx in sorted(rules_by_priority)]
 
         logger.info(
             "Loaded rules",
@@ -95,6 +148,62 @@ class RuleLoader:
 
         return rules
 
+    def _build_rule(
+        self,
+        filepath: Path,
+        priority: int,
+        content: str | OSError | ValueError,
+    ) -> ReviewRule | None:
+        """Build a rule from a file's content, logging why a file is skipped.
+
+        Args:
+            filepath: Path the content was read from.
+            priority: Load order of the file.
+            content: File content, or the error raised reading it.
+
+        Returns:
+            The rule, or None if the file was unreadable, empty or invalid.
+        """
+        try:
+            if isinstance(content, Exception):
+                raise content
+
+            if not content.strip():
+                logger.warning(
+                    "Skipping empty rule file",
+                    extra={"path": str(filepath)},
+                )
+                return None
+
+            rule = ReviewRule(
+                source_file=filepath.name,
+                content=content,
+                priority=priority,
+            )
+
+        except OSError as e:
+            logger.warning(
+                "Failed to read rule file",
+                extra={"path": str(filepath), "error": str(e)},
+            )
+            return None
+        except ValueError as e:
+            logger.warning(
+                "Invalid rule file",
+                extra={"path": str(filepath), "error": str(e)},
+            )
+            return None
+
+        logger.debug(
+            "Loaded rule",
+            extra={
+                "file": filepath.name,
+                "priority": priority,
+                "content_length": len(content),
+            },
+        )
+        return rule
+
     def merge_rules(self, rules: list[ReviewRule]) -> str:
         """Merge multiple rules into a single string.
 
@@ -1,14 +1,23 @@
 """Comment posting tools for the review agent."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from github import Github, GithubException
+from github import GithubException
+from github.GithubObject import NotSet
 
 from app.models.comment import CommentType, ReviewComment
+from app.tools.github import lazy_client
 from app.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from github import Github
+
 logger = get_logger("tools.comments")
 
+# Review body layout when summary comments are batched into one post
+_REVIEW_HEADING = "## Code Review Results\n\n"
+_SUMMARY_SEPARATOR = "\n\n---\n\n"
+
 
 class CommentPostError(Exception):
     """Error raised when comment posting fails."""
@@ -45,10 +54,10 @@ def post_review_comment(
         CommentPostError: If comment cannot be posted.
     """
     try:
-        repo = client.get_repo(repository)
+        repo = lazy_client(client).get_repo(repository)
         pr = repo.get_pull(pr_number)
 
-        # Use PR head if commit_id not specified
+        # Use PR head if commit_id not specified (this fetches the PR)
         if commit_id is None:
             commit_id = pr.head.sha
 
@@ -103,11 +112,10 @@ def post_summary_comment(
         CommentPostError: If comment cannot be posted.
     """
     try:
-        repo = client.get_repo(repository)
-        pr = repo.get_pull(pr_number)
+        repo = lazy_client(client).get_repo(repository)
 
         # Post as issue comment (appears in timeline)
-        comment = pr.create_issue_comment(body=body)
+        comment = repo.get_issue(pr_number).create_comment(body=body)
 
         logger.info(
             "Posted summary comment",
@@ -155,30 +163,24 @@ def create_review(
         CommentPostError: If review cannot be created.
     """
     try:
-        repo = client.get_repo(repository)
+        repo = lazy_client(client).get_repo(repository)
         pr = repo.get_pull(pr_number)
 
-        # Use PR head if commit_id not specified
-        if commit_id is None:
-            commit_id = pr.head.sha
-
-        # Format comments for GitHub API
-        review_comments = []
-        if comments:
-            for c in comments:
-                review_comment = {
-                    "path": c["path"],
-                    "line": c["line"],
-                    "body": c["body"],
-                }
-                if "side" in c:
-                    review_comment["side"] = c["side"]
-                review_comments.append(review_comment)
-
-        # Create the review
+        # Format comments for GitHub API, keeping only the fields it accepts
+        review_comments = [
+            {
+                "path": c["path"],
+                "line": c["line"],
+                "body": c["body"],
+                **({"side": c["side"]} if "side" in c else {}),
+            }
+            for c in comments or ()
+        ]
+
+        # Create the review; without a commit GitHub reviews the PR head
         # PyGithub accepts dicts for comments but types are declared incorrectly
         review = pr.create_review(
-            commit=repo.get_commit(commit_id),
+            commit=repo.get_commit(commit_id) if commit_id is not None else NotSet,
             body=body,
             event=event,
             comments=review_comments,  # type: ignore[arg-type]
@@ -212,7 +214,10 @@ def post_comments(
 ) -> dict[str, Any]:
     """Post multiple review comments efficiently.
 
-    Uses create_review for inline comments and post_summary_comment for summaries.
+    Everything is posted in one request: inline comments go into a single
+    review whose body carries the summary comments, and summaries without
+    inline comments are joined into one issue comment. If the review is
+    rejected, the summaries are still posted as an issue comment.
 
     Args:
         client: Authenticated GitHub client.
@@ -227,8 +232,13 @@ def post_comments(
     Raises:
         CommentPostError: If posting fails.
     """
-    inline_comments = [c for c in comments if c.comment_type == CommentType.INLINE]
-    summary_comments = [c for c in comments if c.comment_type == CommentType.SUMMARY]
+    inline_comments: list[ReviewComment] = []
+    summary_comments: list[ReviewComment] = []
+    for c in comments:
+        if c.comment_type is CommentType.INLINE:
+            inline_comments.append(c)
+        elif c.comment_type is CommentType.SUMMARY:
+            summary_comments.append(c)
 
     results: dict[str, Any] = {
         "inline_posted": 0,
@@ -236,13 +246,13 @@ def post_comments(
         "errors": [],
     }
 
-    # Post inline comments as a single review
+    summary_body = _SUMMARY_SEPARATOR.join(c.body for c in summary_comments)
+
+    # Post inline comments as a single review, with the summaries as its body
     if inline_comments:
         try:
             review_comments = [c.to_github_review_comment() for c in inline_comments]
-
-            # Build summary from inline comments if no explicit summary
-            review_body = "## Code Review Results\n\nSee inline comments below."
+            review_body = _REVIEW_HEADING + (summary_body or "See inline comments below.")
 
             create_review(
                 client=client,
@@ -254,20 +264,22 @@ def post_comments(
                 commit_id=commit_id,
             )
             results["inline_posted"] = len(inline_comments)
+            results["summary_posted"] = len(summary_comments)
 
         except CommentPostError as e:
             results["errors"].append(f"Failed to post inline comments: {e}")
 
-    # Post summary comments
-    for comment in summary_comments:
+    # Without a review to carry them (none needed, or it was rejected),
+    # summaries go out as one issue comment
+    if summary_comments and not results["summary_posted"]:
         try:
             post_summary_comment(
                 client=client,
                 pr_number=pr_number,
                 repository=repository,
-                body=comment.body,
+                body=summary_body,
             )
-            results["summary_posted"] += 1
+            results["summary_posted"] = len(summary_comments)
 
         except CommentPostError as e:
             results["errors"].append(f"Failed to post summary: {e}")
@@ -3,6 +3,10 @@
 import re
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class LineChangeType(str, Enum):
@@ -13,7 +17,7 @@ class LineChangeType(str, Enum):
     CONTEXT = "context"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangedLine:
     """Represents a changed line in a diff."""
 
@@ -23,7 +27,7 @@ class ChangedLine:
     new_line_number: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffHunk:
     """Represents a hunk in a unified diff."""
 
@@ -45,8 +49,12 @@ class DiffHunk:
         return self.old_count > 0 and self.new_count == 0
 
 
-# Pattern to match hunk headers: @@ -old_start,old_count +new_start,new_count @@
-HUNK_HEADER_PATTERN = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+# Pattern to match hunk header lines: @@ -old_start,old_count +new_start,new_count @@
+# Multiline so a whole patch can be scanned for headers in one pass
+HUNK_HEADER_PATTERN = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@[^\n]*", re.MULTILINE)
+
+# Diff line prefixes that exist on the new side of a file (additions, context)
+_NEW_SIDE_PREFIXES = frozenset({"+", " "})
 
 
 def parse_unified_diff(patch: str | None) -> list[DiffHunk]:
@@ -61,44 +69,81 @@ def parse_unified_diff(patch: str | None) -> list[DiffHunk]:
     if not patch:
         return []
 
+    # Locate every hunk header in one scan; each hunk's body runs from the
+    # line after its header up to the newline before the next header
+    matches = list(HUNK_HEADER_PATTERN.finditer(patch))
+    ends = [match.start() - 1 for match in matches[1:]]
+    if matches:
+        ends.append(len(patch))
+
     hunks: list[DiffHunk] = []
-    current_hunk: DiffHunk | None = None
-    current_lines: list[str] = []
+    for match, end in zip(matches, ends, strict=True):
+        start = match.end() + 1
+        hunks.append(
+            DiffHunk(
+                old_start=int(match.group(1)),
+                old_count=int(match.group(2)) if match.group(2) else 1,
+                new_start=int(match.group(3)),
+                new_count=int(match.group(4)) if match.group(4) else 1,
+                header=match.group(),
+                lines=patch[start:end].split("\n") if start <= end else [],
+            )
+        )
+
+    return hunks
+
+
+def _iter_changed_lines(patch: str) -> Iterator[ChangedLine]:
+    """Yield added and removed lines of a patch in a single pass.
+
+    Line numbers are tracked inline, so no intermediate DiffHunk objects are
+    built. Lines before the first hunk header are ignored.
+
+    Args:
+        patch: The unified diff patch content.
+
+    Yields:
+        ChangedLine objects for additions and removals, in patch order.
+    """
+    in_hunk = False
+    old_line = new_line = 0
 
     for line in patch.split("\n"):
-        match = HUNK_HEADER_PATTERN.match(line)
-
-        if match:
-            # Save previous hunk if exists
-            if current_hunk is not None:
-                current_hunk.lines = current_lines
-                hunks.append(current_hunk)
-
-            # Parse hunk header
-            old_start = int(match.group(1))
-            old_count = int(match.group(2)) if match.group(2) else 1
-            new_start = int(match.group(3))
-            new_count = int(match.group(4)) if match.group(4) else 1
-
-            current_hunk = DiffHunk(
-                old_start=old_start,
-                old_count=old_count,
-                new_start=new_start,
-                new_count=new_count,
-                header=line,
-                lines=[],
-            )
-            current_lines = []
+        prefix = line[:1]
+
+        if prefix == "@":
+            match = HUNK_HEADER_PATTERN.match(line)
+            if match:
+                in_hunk = True
+                old_line = int(match.group(1))
+                new_line = int(match.group(3))
+            continue
 
-        elif current_hunk is not None:
-            current_lines.append(line)
+        if not in_hunk:
+            continue
 
-    # Save final hunk
-    if current_hunk is not None:
-        current_hunk.lines = current_lines
-        hunks.append(current_hunk)
+        if prefix == "+":
+            yield ChangedLine(
+                change_type=LineChangeType.ADDED,
+                content=line[1:],
+                old_line_number=None,
+                new_line_number=new_line,
+            )
+            new_line += 1
 
-    return hunks
+        elif prefix == "-":
+            yield ChangedLine(
+                change_type=LineChangeType.REMOVED,
+                content=line[1:],
+                old_line_number=old_line,
+                new_line_number=None,
+            )
+            old_line += 1
+
+        elif prefix == " ":
+            # Context line; "\ No newline at end of file" advances nothing
+            old_line += 1
+            new_line += 1
 
 
 def extract_changed_lines(patch: str | None) -> list[ChangedLine]:
@@ -113,49 +158,7 @@ def extract_changed_lines(patch: str | None) -> list[ChangedLine]:
     if not patch:
         return []
 
-    hunks = parse_unified_diff(patch)
-    changed_lines: list[ChangedLine] = []
-
-    for hunk in hunks:
-        old_line = hunk.old_start
-        new_line = hunk.new_start
-
-        for line in hunk.lines:
-            if not line:
-                continue
-
-            prefix = line[0] if line else " "
-            content = line[1:] if len(line) > 1 else ""
-
-            if prefix == "+":
-                changed_lines.append(
-                    ChangedLine(
-                        change_type=LineChangeType.ADDED,
-                        content=content,
-                        old_line_number=None,
-                        new_line_number=new_line,
-                    )
-                )
-                new_line += 1
-
-            elif prefix == "-":
-                changed_lines.append(
-                    ChangedLine(
-                        change_type=LineChangeType.REMOVED,
-                        content=content,
-                        old_line_number=old_line,
-                        new_line_number=None,
-                    )
-                )
-                old_line += 1
-
-            elif prefix in {" ", "\\"}:
-                # Context line or "\ No newline at end of file"
-                if prefix == " ":
-                    old_line += 1
-                    new_line += 1
-
-    return changed_lines
+    return list(_iter_changed_lines(patch))
 
 
 def get_line_at_position(patch: str | None, position: int) -> int | None:
@@ -171,33 +174,32 @@ def get_line_at_position(patch: str | None, position: int) -> int | None:
     Returns:
         The new file line number, or None if position is invalid.
     """
-    if not patch:
+    if not patch or position < 1:
         return None
 
-    lines = patch.split("\n")
-
-    if position < 1 or position > len(lines):
+    # Lines past the requested position are never looked at, so stop splitting there
+    lines = patch.split("\n", position)
+    if position > len(lines):
         return None
 
-    # Find the hunk containing this position
-    current_position = 0
     new_line = 0
 
-    for line in lines:
-        current_position += 1
+    for current_position, line in enumerate(lines, 1):
+        prefix = line[:1]
 
-        match = HUNK_HEADER_PATTERN.match(line)
-        if match:
-            new_line = int(match.group(3))
-            if match.group(4):
-                pass  # new_count not needed here
-            continue
+        if prefix == "@":
+            match = HUNK_HEADER_PATTERN.match(line)
+            if match:
+                if current_position == position:
+                    return None
+                new_line = int(match.group(3))
+                continue
 
         if current_position == position:
-            return new_line if line.startswith("+") or line.startswith(" ") else None
+            return new_line if prefix in _NEW_SIDE_PREFIXES else None
 
-        # Update line counter
-        if line.startswith("+") or line.startswith(" ") or not line.startswith("-"):
+        # Every line except a removal advances the new-file line counter
+        if prefix != "-":
             new_line += 1
 
     return None
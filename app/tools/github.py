@@ -1,15 +1,62 @@
 """GitHub API tools for the review agent."""
 
-import base64
+import binascii
 import os
-from typing import Any
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from github import Auth, Github, GithubException, GithubIntegration
 
 from app.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from github.PullRequest import PullRequest
+
 logger = get_logger("tools.github")
 
+# Webhooks for one PR tend to arrive in bursts, so PR metadata and file lists
+# are briefly cached to spare redundant API calls (and rate limit). File lists
+# are keyed by head SHA as well, so a push is never served the previous head's
+# files; metadata (which is how the head is learned) is keyed with None.
+_PR_CACHE_TTL_SECONDS = 60.0
+_PR_CACHE_SIZE = 1024
+_pr_cache: OrderedDict[tuple[str, str, int, str | None], tuple[float, Any]] = OrderedDict()
+_pr_cache_lock = threading.Lock()
+
+# PullRequest objects shared by the tools within the same TTL, per client
+# (objects carry their client's credentials) and keyed like _pr_cache. Weakly
+# keyed so callers still control client lifetime; guarded by _pr_cache_lock.
+_pull_cache: weakref.WeakKeyDictionary[
+    Github, dict[tuple[str, int, str | None], tuple[float, PullRequest]]
+] = weakref.WeakKeyDictionary()
+
+# Lazy counterparts of the clients passed in. Repository, pull request, issue
+# and commit handles from a lazy client are built from their URLs instead of
+# each costing a GET; data is fetched only when an unset attribute is read.
+# Weakly keyed so callers still control client lifetime.
+_lazy_clients: weakref.WeakKeyDictionary[Github, Github] = weakref.WeakKeyDictionary()
+_lazy_clients_lock = threading.Lock()
+
+# One integration per App credential and one client per installation, so
+# HTTP connections are kept alive across webhooks. Installation tokens are
+# refreshed by PyGithub when they expire, so clients stay usable.
+_integrations: dict[tuple[int, str], GithubIntegration] = {}
+_installation_clients: dict[tuple[int, str, int], Github] = {}
+_clients_lock = threading.Lock()
+
+# Upper bound on concurrent content requests per bulk call, to stay clear of
+# GitHub's secondary rate limits
+_MAX_CONTENT_WORKERS = 8
+
+
+# Cached "files" entry: file dictionaries in API order, and the same
+# dictionaries indexed by filename
+type _PRFiles = tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]
+
 
 class GitHubToolError(Exception):
     """Error raised by GitHub tools."""
@@ -17,6 +64,144 @@ class GitHubToolError(Exception):
     pass
 
 
+def _pr_cache_get(kind: str, repository: str, pr_number: int, head_sha: str | None) -> Any:
+    """Look up an unexpired PR cache entry.
+
+    Args:
+        kind: What was cached ("metadata" or "files").
+        repository: Repository in owner/repo format.
+        pr_number: Pull request number.
+        head_sha: Head commit the entry belongs to, or None for metadata.
+
+    Returns:
+        The cached value, or None if missing or expired.
+    """
+    key = (kind, repository, pr_number, head_sha)
+    with _pr_cache_lock:
+        entry = _pr_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del _pr_cache[key]
+            return None
+        return value
+
+
+def _pr_cache_put(
+    kind: str, repository: str, pr_number: int, head_sha: str | None, value: Any
+) -> None:
+    """Store a PR cache entry.
+
+    Args:
+        kind: What is being cached ("metadata" or "files").
+        repository: Repository in owner/repo format.
+        pr_number: Pull request number.
+        head_sha: Head commit the entry belongs to, or None for metadata.
+        value: The value to cache.
+    """
+    key = (kind, repository, pr_number, head_sha)
+    with _pr_cache_lock:
+        _pr_cache[key] = (time.monotonic() + _PR_CACHE_TTL_SECONDS, value)
+        _pr_cache.move_to_end(key)
+        if len(_pr_cache) > _PR_CACHE_SIZE:
+            _pr_cache.popitem(last=False)
+
+
+def invalidate_pr_cache(repository: str, pr_number: int) -> None:
+    """Drop cached metadata and files (for every head) for a pull request.
+
+    Args:
+        repository: Repository in owner/repo format.
+        pr_number: Pull request number.
+    """
+    pr_key = (repository, pr_number)
+    with _pr_cache_lock:
+        for cache_key in [k for k in _pr_cache if k[1:3] == pr_key]:
+            del _pr_cache[cache_key]
+        for pulls in _pull_cache.values():
+            for pull_key in [k for k in pulls if k[:2] == pr_key]:
+                del pulls[pull_key]
+
+
+def clear_pr_cache() -> None:
+    """Drop all cached PR metadata, file lists and pull request objects."""
+    with _pr_cache_lock:
+        _pr_cache.clear()
+        _pull_cache.clear()
+
+
+def lazy_client(client: Github) -> Github:
+    """Get a lazy client sharing the given client's configuration.
+
+    Args:
+        client: Authenticated GitHub client.
+
+    Returns:
+        Github client whose objects are only fetched when an unset
+        attribute is read.
+    """
+    with _lazy_clients_lock:
+        lazy = _lazy_clients.get(client)
+        if lazy is None:
+            lazy = _lazy_clients[client] = client.withLazy(True)
+        return lazy
+
+
+def _remember_pr(client: Github, key: tuple[str, int, str | None], pr: PullRequest) -> None:
+    """Share a pull request object with later tool calls by the same client.
+
+    Args:
+        client: Authenticated GitHub client.
+        key: Repository, pull request number and head SHA (or None).
+        pr: The PullRequest object.
+    """
+    with _pr_cache_lock:
+        pulls = _pull_cache.setdefault(client, {})
+        # Expired entries for other PRs are dropped here rather than swept
+        now = time.monotonic()
+        for stale in [k for k, (expires_at, _) in pulls.items() if expires_at <= now]:
+            del pulls[stale]
+        pulls[key] = (now + _PR_CACHE_TTL_SECONDS, pr)
+
+
+def _get_pr(
+    client: Github, repository: str, pr_number: int, head_sha: str | None = None
+) -> PullRequest:
+    """Get a pull request, reusing one fetched recently by the same client.
+
+    Args:
+        client: Authenticated GitHub client.
+        repository: Repository in owner/repo format.
+        pr_number: Pull request number.
+        head_sha: Head commit the caller works on, if known.
+
+    Returns:
+        The PullRequest object.
+
+    Raises:
+        GithubException: If the repository or pull request cannot be fetched.
+    """
+    key = (repository, pr_number, head_sha)
+    with _pr_cache_lock:
+        entry = _pull_cache.get(client, {}).get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    # The PR itself is fetched when its data is first read (e.g. metadata);
+    # listing files only needs its URL
+    pr = lazy_client(client).get_repo(repository).get_pull(pr_number)
+    _remember_pr(client, key, pr)
+    return pr
+
+
+def clear_client_cache() -> None:
+    """Drop cached GitHub App integrations and installation clients."""
+    with _clients_lock:
+        _integrations.clear()
+        _installation_clients.clear()
+
+
 def _get_private_key() -> str:
     """Get the GitHub App private key from environment.
 
@@ -65,9 +250,16 @@ def create_github_client(installation_id: int) -> Github:
 
     try:
         private_key = _get_private_key()
-        auth = Auth.AppAuth(int(app_id), private_key)
-        gi = GithubIntegration(auth=auth)
-        return gi.get_github_for_installation(installation_id)
+        app_key = (int(app_id), private_key)
+        with _clients_lock:
+            client = _installation_clients.get((*app_key, installation_id))
+            if client is None:
+                gi = _integrations.get(app_key)
+                if gi is None:
+                    gi = _integrations[app_key] = GithubIntegration(auth=Auth.AppAuth(*app_key))
+                client = gi.get_github_for_installation(installation_id)
+                _installation_clients[(*app_key, installation_id)] = client
+            return client
     except Exception as e:
         raise GitHubToolError(f"Failed to create GitHub client: {e}") from e
 
@@ -90,16 +282,21 @@ def get_pr_metadata(
     Raises:
         GitHubToolError: If PR cannot be fetched.
     """
+    cached = _pr_cache_get("metadata", repository, pr_number, None)
+    if cached is not None:
+        return dict(cached)
+
     try:
-        repo = client.get_repo(repository)
-        pr = repo.get_pull(pr_number)
+        pr = _get_pr(client, repository, pr_number)
 
-        return {
+        metadata = {
             "title": pr.title,
             "body": pr.body,
             "author": pr.user.login,
             "base_branch": pr.base.ref,
             "head_branch": pr.head.ref,
+            "head_sha": pr.head.sha,
+            "html_url": pr.html_url,
             "files_changed": pr.changed_files,
             "additions": pr.additions,
             "deletions": pr.deletions,
@@ -110,42 +307,57 @@ def get_pr_metadata(
             raise GitHubToolError(f"PR #{pr_number} not found in {repository}") from e
         raise GitHubToolError(f"GitHub API error: {e}") from e
 
+    # The loaded PR now also serves file listings for the head it reported
+    _remember_pr(client, (repository, pr_number, pr.head.sha), pr)
+    _pr_cache_put("metadata", repository, pr_number, None, metadata)
+    return dict(metadata)
 
-def list_pr_files(
-    client: Github,
-    pr_number: int,
-    repository: str,
-) -> list[dict[str, Any]]:
-    """List all files changed in a pull request.
+
+def _get_pr_files(
+    client: Github, pr_number: int, repository: str, head_sha: str | None
+) -> _PRFiles:
+    """Get the changed files of a pull request, fetching them at most once per TTL.
+
+    The returned list and index are shared with the cache and must not be
+    mutated.
 
     Args:
         client: Authenticated GitHub client.
         pr_number: Pull request number.
         repository: Repository in owner/repo format.
+        head_sha: Head commit the files belong to. Defaults to the head
+            reported by get_pr_metadata.
 
     Returns:
-        List of file information dictionaries.
+        Tuple of (file information dictionaries in API order, the same
+        dictionaries indexed by filename).
 
     Raises:
         GitHubToolError: If files cannot be fetched.
     """
+    if head_sha is None:
+        head_sha = get_pr_metadata(client, pr_number, repository)["head_sha"]
+
+    cached: _PRFiles | None = _pr_cache_get("files", repository, pr_number, head_sha)
+    if cached is not None:
+        return cached
+
     try:
-        repo = client.get_repo(repository)
-        pr = repo.get_pull(pr_number)
-
-        files = []
-        for f in pr.get_files():
-            files.append(
-                {
-                    "filename": f.filename,
-                    "status": f.status,
-                    "additions": f.additions,
-                    "deletions": f.deletions,
-                    "sha": f.sha,
-                    "patch": getattr(f, "patch", None),
-                    "previous_filename": getattr(f, "previous_filename", None),
-                }
-            )
+        pr = _get_pr(client, repository, pr_number, head_sha)
+
+        # File always defines patch and previous_filename (None when absent)
+        files: list[dict[str, Any]] = [
+            {
+                "filename": f.filename,
+                "status": f.status,
+                "additions": f.additions,
+                "deletions": f.deletions,
+                "sha": f.sha,
+                "patch": f.patch,
+                "previous_filename": f.previous_filename,
+            }
+            for f in pr.get_files()
+        ]
 
         logger.info(
             "Listed PR files",
@@ -156,50 +368,109 @@ def list_pr_files(
             },
         )
 
-        return files
-
     except GithubException as e:
         raise GitHubToolError(f"Failed to list PR files: {e}") from e
 
+    entry = (files, {f["filename"]: f for f in files})
+    _pr_cache_put("files", repository, pr_number, head_sha, entry)
+    return entry
+
+
+def list_pr_files(
+    client: Github,
+    pr_number: int,
+    repository: str,
+    include_patch: bool = True,
+    head_sha: str | None = None,
+) -> list[dict[str, Any]]:
+    """List all files changed in a pull request.
+
+    Args:
+        client: Authenticated GitHub client.
+        pr_number: Pull request number.
+        repository: Repository in owner/repo format.
+        include_patch: Whether entries carry the file's patch. Without it,
+            callers that only enumerate files don't hold every diff.
+        head_sha: Head commit the files should belong to (e.g. from the
+            webhook payload). Defaults to the head reported by get_pr_metadata.
+
+    Returns:
+        List of file information dictionaries, each a copy the caller owns.
+
+    Raises:
+        GitHubToolError: If files cannot be fetched.
+    """
+    files, _ = _get_pr_files(client, pr_number, repository, head_sha)
+    if include_patch:
+        return [dict(f) for f in files]
+    return [{key: value for key, value in f.items() if key != "patch"} for f in files]
+
+
+def list_pr_filenames(
+    client: Github,
+    pr_number: int,
+    repository: str,
+    head_sha: str | None = None,
+) -> list[dict[str, Any]]:
+    """List files changed in a pull request, without their patches.
+
+    Patches can be fetched per file with get_file_diff.
+
+    Args:
+        client: Authenticated GitHub client.
+        pr_number: Pull request number.
+        repository: Repository in owner/repo format.
+        head_sha: Head commit the files should belong to. Defaults to the
+            head reported by get_pr_metadata.
+
+    Returns:
+        List of file information dictionaries without the patch key.
+
+    Raises:
+        GitHubToolError: If files cannot be fetched.
+    """
+    return list_pr_files(client, pr_number, repository, include_patch=False, head_sha=head_sha)
+
 
 def get_file_diff(
     client: Github,
     pr_number: int,
     repository: str,
     file_path: str,
+    head_sha: str | None = None,
 ) -> dict[str, Any]:
     """Get the diff for a specific file in a pull request.
 
+    Uses the same file list as list_pr_files, indexed by filename, so diffs
+    for several files of one PR cost a single listing and a lookup each.
+
     Args:
         client: Authenticated GitHub client.
         pr_number: Pull request number.
         repository: Repository in owner/repo format.
         file_path: Path to the file in the repository.
+        head_sha: Head commit the diff should belong to. Defaults to the
+            head reported by get_pr_metadata.
 
     Returns:
         Dictionary with file diff information.
 
     Raises:
-        GitHubToolError: If file is not found in PR.
+        GitHubToolError: If file is not found in PR or files cannot be fetched.
     """
+    _, files_by_name = _get_pr_files(client, pr_number, repository, head_sha)
     try:
-        repo = client.get_repo(repository)
-        pr = repo.get_pull(pr_number)
+        f = files_by_name[file_path]
+    except KeyError:
+        raise GitHubToolError(f"File '{file_path}' not found in PR #{pr_number}") from None
 
-        for f in pr.get_files():
-            if f.filename == file_path:
-                return {
-                    "filename": f.filename,
-                    "status": f.status,
-                    "patch": getattr(f, "patch", None),
-                    "additions": f.additions,
-                    "deletions": f.deletions,
-                }
-
-        raise GitHubToolError(f"File '{file_path}' not found in PR #{pr_number}")
-
-    except GithubException as e:
-        raise GitHubToolError(f"Failed to get file diff: {e}") from e
+    return {
+        "filename": f["filename"],
+        "status": f["status"],
+        "patch": f["patch"],
+        "additions": f["additions"],
+        "deletions": f["deletions"],
+    }
 
 
 def get_file_content(
@@ -223,7 +494,7 @@ def get_file_content(
         GitHubToolError: If file cannot be fetched.
     """
     try:
-        repo = client.get_repo(repository)
+        repo = lazy_client(client).get_repo(repository)
         content = repo.get_contents(file_path, ref=ref)
 
         # Handle directory case
@@ -232,7 +503,9 @@ def get_file_content(
 
         # Decode content
         if content.encoding == "base64":
-            decoded = base64.b64decode(content.content).decode("utf-8")
+            # a2b_base64 takes the ASCII str as-is and skips GitHub's line
+            # wraps, so there's no intermediate encode or copy
+            decoded = binascii.a2b_base64(content.content).decode("utf-8")
         else:
             decoded = content.content
 
@@ -246,3 +519,36 @@ def get_file_content(
         if e.status == 404:
             raise GitHubToolError(f"File '{file_path}' not found at ref '{ref}'") from e
         raise GitHubToolError(f"Failed to get file content: {e}") from e
+
+
+def get_files_content_bulk(
+    client: Github,
+    repository: str,
+    refs_and_paths: list[tuple[str, str]],
+    max_workers: int = _MAX_CONTENT_WORKERS,
+) -> list[dict[str, Any]]:
+    """Get the full content of several files concurrently.
+
+    Args:
+        client: Authenticated GitHub client.
+        repository: Repository in owner/repo format.
+        refs_and_paths: (ref, file_path) pairs to fetch.
+        max_workers: Maximum number of concurrent requests.
+
+    Returns:
+        File content dictionaries (as from get_file_content), in the same
+        order as refs_and_paths.
+
+    Raises:
+        GitHubToolError: If any file cannot be fetched.
+    """
+    if len(refs_and_paths) <= 1:
+        return [get_file_content(client, repository, path, ref) for ref, path in refs_and_paths]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(refs_and_paths))) as executor:
+        return list(
+            executor.map(
+                lambda item: get_file_content(client, repository, item[1], item[0]),
+                refs_and_paths,
+            )
+        )
@@ -1,5 +1,8 @@
 """Repository configuration loader."""
 
+import threading
+from collections import OrderedDict
+from dataclasses import replace
 from pathlib import Path  # noqa: TC003
 from typing import Any
 
@@ -10,6 +13,9 @@ from app.utils.logging import get_logger
 
 logger = get_logger("utils.config_loader")
 
+# libyaml's C loader when PyYAML was built with it; same results, much faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigLoaderError(Exception):
     """Error raised when configuration loading fails."""
@@ -23,6 +29,18 @@ CONFIG_FILE_NAMES = [
     ".reviewbot.yaml",
 ]
 
+# Parsed configs keyed by resolved path, with the (mtime_ns, size) they were
+# parsed at, so bursts of webhooks for one repository parse its config once
+_CONFIG_CACHE_SIZE = 128
+_config_cache: OrderedDict[str, tuple[int, int, AgentConfig]] = OrderedDict()
+_config_cache_lock = threading.Lock()
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configurations."""
+    with _config_cache_lock:
+        _config_cache.clear()
+
 
 def load_repo_config(repo_root: Path) -> AgentConfig:
     """Load configuration from a repository.
@@ -48,6 +66,38 @@ def load_repo_config(repo_root: Path) -> AgentConfig:
         logger.debug("No config file found, using defaults", extra={"path": str(repo_root)})
         return AgentConfig.default()
 
+    stat = config_file.stat()
+    cache_key = str(config_file.resolve())
+    with _config_cache_lock:
+        cached = _config_cache.get(cache_key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _config_cache.move_to_end(cache_key)
+            # Callers get their own copy of the mutable pattern list
+            return replace(cached[2], excluded_patterns=list(cached[2].excluded_patterns))
+
+    config = _parse_config_file(config_file)
+
+    with _config_cache_lock:
+        _config_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+        _config_cache.move_to_end(cache_key)
+        if len(_config_cache) > _CONFIG_CACHE_SIZE:
+            _config_cache.popitem(last=False)
+
+    return replace(config, excluded_patterns=list(config.excluded_patterns))
+
+
+def _parse_config_file(config_file: Path) -> AgentConfig:
+    """Parse and validate a configuration file.
+
+    Args:
+        config_file: Path to the config file.
+
+    Returns:
+        AgentConfig instance (defaults if the file is empty).
+
+    Raises:
+        ConfigLoaderError: If the file is invalid.
+    """
     try:
         raw_config = _load_yaml_file(config_file)
     except yaml.YAMLError as e:
@@ -101,10 +151,11 @@ def _load_yaml_file(filepath: Path) -> dict[str, Any] | None:
         yaml.YAMLError: If YAML is invalid.
         OSError: If file cannot be read.
     """
-    content = filepath.read_text(encoding="utf-8")
+    # The loader detects the encoding (UTF-8 unless there's a BOM) itself
+    content = filepath.read_bytes()
 
     if not content.strip():
         return None
 
-    result: dict[str, Any] | None = yaml.safe_load(content)
+    result: dict[str, Any] | None = yaml.load(content, Loader=_YAML_LOADER)
     return result
@@ -5,37 +5,44 @@ import logging
 import os
 import traceback
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any, ClassVar
 
+# json.dumps builds a new encoder whenever an option like default= is passed,
+# so log entries share a single one instead
+_ENCODER = json.JSONEncoder(default=str)
+
 
 class JsonFormatter(logging.Formatter):
     """Format log records as JSON for structured logging."""
 
     # Fields that are part of the standard LogRecord but not useful in JSON output
-    RESERVED_ATTRS: ClassVar[set[str]] = {
-        "name",
-        "msg",
-        "args",
-        "created",
-        "filename",
-        "funcName",
-        "levelname",
-        "levelno",
-        "lineno",
-        "module",
-        "msecs",
-        "pathname",
-        "process",
-        "processName",
-        "relativeCreated",
-        "stack_info",
-        "exc_info",
-        "exc_text",
-        "thread",
-        "threadName",
-        "taskName",
-        "message",
-    }
+    RESERVED_ATTRS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "name",
+            "msg",
+            "args",
+            "created",
+            "filename",
+            "funcName",
+            "levelname",
+            "levelno",
+            "lineno",
+            "module",
+            "msecs",
+            "pathname",
+            "process",
+            "processName",
+            "relativeCreated",
+            "stack_info",
+            "exc_info",
+            "exc_text",
+            "thread",
+            "threadName",
+            "taskName",
+            "message",
+        }
+    )
 
     def format(self, record: logging.LogRecord) -> str:
         """Format a log record as JSON.
@@ -66,17 +73,14 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             log_entry["exception"] = "".join(traceback.format_exception(*record.exc_info))
 
-        # Add any extra fields from the log record
+        # Add any extra fields from the log record. Values that aren't JSON
+        # serializable are converted with str() by the encoder
+        reserved = self.RESERVED_ATTRS
         for key, value in record.__dict__.items():
-            if key not in self.RESERVED_ATTRS and not key.startswith("_"):
-                try:
-                    # Ensure value is JSON serializable
-                    json.dumps(value)
-                    log_entry[key] = value
-                except (TypeError, ValueError):
-                    log_entry[key] = str(value)
+            if key not in reserved and not key.startswith("_"):
+                log_entry[key] = value
 
-        return json.dumps(log_entry, default=str)
+        return _ENCODER.encode(log_entry)
 
 
 def configure_logging(name: str = "reviewbot") -> logging.Logger:
@@ -114,9 +118,12 @@ def configure_logging(name: str = "reviewbot") -> logging.Logger:
     return logger
 
 
+@lru_cache(maxsize=64)
 def get_logger(module_name: str) -> logging.Logger:
     """Get a child logger for a specific module.
 
+    Loggers are singletons, so the lookup is memoized per module name.
+
     Args:
         module_name: The module name to create a child logger for.
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import random
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -28,7 +28,7 @@ class RetryError(Exception):
         self.__cause__ = last_exception
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
     """Configuration for retry behavior."""
 
@@ -47,6 +47,25 @@ class RetryConfig:
     jitter: bool = True
     """Whether to add random jitter to delays."""
 
+    _delays: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    """Capped delay before each retry, without jitter."""
+
+    def __post_init__(self) -> None:
+        """Precompute the delay before each retry."""
+        delays = tuple(self._base_delay_for(attempt) for attempt in range(self.max_retries))
+        object.__setattr__(self, "_delays", delays)
+
+    def _base_delay_for(self, attempt: int) -> float:
+        """Calculate the capped delay for an attempt, without jitter.
+
+        Args:
+            attempt: The retry attempt number (0-indexed).
+
+        Returns:
+            Delay in seconds.
+        """
+        return min(self.base_delay * (self.exponential_base**attempt), self.max_delay)
+
     def calculate_delay(self, attempt: int) -> float:
         """Calculate the delay for a given retry attempt.
 
@@ -56,8 +75,10 @@ class RetryConfig:
         Returns:
             Delay in seconds.
         """
-        delay = self.base_delay * (self.exponential_base**attempt)
-        delay = min(delay, self.max_delay)
+        if 0 <= attempt < len(self._delays):
+            delay = self._delays[attempt]
+        else:
+            delay = self._base_delay_for(attempt)
 
         if self.jitter:
             # Add up to 25% jitter
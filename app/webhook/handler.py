@@ -1,10 +1,15 @@
 """Webhook event handler and dispatcher."""
 
-from typing import Any, ClassVar
+import json
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from app.models.pull_request import PullRequest
+from app.tools.github import invalidate_pr_cache
 from app.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = get_logger("webhook.handler")
 
 
@@ -14,6 +19,32 @@ class WebhookParseError(Exception):
     pass
 
 
+def parse_webhook_bytes(raw: bytes | str) -> dict[str, Any]:
+    """Parse a raw webhook body into its payload.
+
+    The bytes are handed to the JSON parser as-is; it detects the encoding
+    itself, so there is no separate decode step.
+
+    Args:
+        raw: The request body (or the already-decoded body text).
+
+    Returns:
+        The webhook payload.
+
+    Raises:
+        WebhookParseError: If the body is not a JSON object.
+    """
+    try:
+        payload = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise WebhookParseError(f"Invalid JSON: {e}") from e
+
+    if not isinstance(payload, dict):
+        raise WebhookParseError(f"Payload must be a JSON object, got {type(payload).__name__}")
+
+    return payload
+
+
 def parse_pr_event(payload: dict[str, Any]) -> PullRequest:
     """Parse a pull_request webhook event.
 
@@ -64,11 +95,37 @@ def parse_ping_event(payload: dict[str, Any]) -> dict[str, Any]:
 
 
 class WebhookHandler:
-    """Handles and dispatches GitHub webhook events."""
+    """Handles and dispatches GitHub webhook events.
+
+    Instances hold no per-request state and are safe to share across threads.
+    """
 
     # Actions that should trigger a review
     REVIEW_ACTIONS: ClassVar[set[str]] = {"opened", "synchronize", "reopened"}
 
+    # Actions after which cached PR metadata/files are stale
+    CACHE_INVALIDATING_ACTIONS: ClassVar[set[str]] = {"synchronize", "edited"}
+
+    def __init__(self) -> None:
+        """Initialize the handler with its event dispatch table."""
+        # Event types with a dedicated handler; everything else is ignored
+        self._handlers: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+            "pull_request": self._handle_pull_request,
+            "ping": self._handle_ping,
+            "installation": self._handle_installation,
+        }
+
+    def handles(self, event_type: str) -> bool:
+        """Check whether an event type has a dedicated handler.
+
+        Args:
+            event_type: The X-GitHub-Event header value.
+
+        Returns:
+            True if dispatch would route the event to a handler.
+        """
+        return event_type in self._handlers
+
     def dispatch(self, event_type: str, payload: dict[str, Any]) -> dict[str, Any]:
         """Dispatch a webhook event to the appropriate handler.
 
@@ -84,14 +141,10 @@ class WebhookHandler:
             extra={"event_type": event_type, "action": payload.get("action")},
         )
 
-        if event_type == "pull_request":
-            return self._handle_pull_request(payload)
-        elif event_type == "ping":
-            return self._handle_ping(payload)
-        elif event_type == "installation":
-            return self._handle_installation(payload)
-        else:
+        handler = self._handlers.get(event_type)
+        if handler is None:
             return self._handle_unsupported(event_type, payload)
+        return handler(payload)
 
     def _handle_pull_request(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Handle a pull_request event.
@@ -105,6 +158,12 @@ class WebhookHandler:
         action = payload.get("action", "")
         should_review = action in self.REVIEW_ACTIONS
 
+        if action in self.CACHE_INVALIDATING_ACTIONS:
+            repository = payload.get("repository", {}).get("full_name")
+            pr_number = payload.get("number")
+            if repository and pr_number:
+                invalidate_pr_cache(repository, pr_number)
+
         result: dict[str, Any] = {
             "event_type": "pull_request",
             "action": action,
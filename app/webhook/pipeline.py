@@ -0,0 +1,84 @@
+"""Runtime-independent webhook processing.
+
+Verifies, parses and dispatches a GitHub webhook delivery. Entrypoints only
+adapt the request and response to their runtime and act on the dispatch
+result (e.g. queueing a review).
+"""
+
+from typing import Any
+
+from app.utils.logging import get_logger
+from app.webhook.handler import WebhookHandler, WebhookParseError, parse_webhook_bytes
+from app.webhook.validators import WebhookSignatureError, verify_webhook_signature
+
+logger = get_logger("webhook.pipeline")
+
+# WebhookHandler is stateless, so one instance serves every request (and
+# every thread) for the life of the process
+_HANDLER = WebhookHandler()
+
+
+def process_webhook(
+    body: bytes,
+    signature: str,
+    event_type: str,
+    delivery_id: str,
+    secret: str,
+    *,
+    body_text: str | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """Verify, parse and dispatch a GitHub webhook delivery.
+
+    Args:
+        body: Raw request body bytes.
+        signature: X-Hub-Signature-256 header value.
+        event_type: X-GitHub-Event header value.
+        delivery_id: X-GitHub-Delivery header value.
+        secret: Webhook secret configured in the GitHub App.
+        body_text: Optional already-decoded body. When given, it is parsed
+            directly instead of decoding ``body`` a second time.
+
+    Returns:
+        Tuple of (HTTP status, data). On 200 the data is the dispatch result;
+        otherwise it carries ``error`` and ``message`` keys.
+    """
+    if not secret:
+        logger.error("GITHUB_WEBHOOK_SECRET not configured")
+        return 500, {
+            "error": "configuration_error",
+            "message": "Webhook secret not configured",
+        }
+
+    # Unhandled events have no side effects, so answer them without hashing
+    # the (potentially large) body
+    if not _HANDLER.handles(event_type):
+        return 200, {"event_type": event_type, "status": "ignored"}
+
+    try:
+        verify_webhook_signature(body, signature, secret)
+    except WebhookSignatureError as e:
+        logger.warning(
+            "Signature verification failed",
+            extra={"delivery_id": delivery_id, "error": str(e)},
+        )
+        return 403, {"error": "invalid_signature", "message": str(e)}
+
+    try:
+        payload = parse_webhook_bytes(body if body_text is None else body_text)
+    except WebhookParseError as e:
+        logger.warning(
+            "Invalid JSON payload",
+            extra={"delivery_id": delivery_id, "error": str(e)},
+        )
+        return 400, {"error": "invalid_payload", "message": str(e)}
+
+    try:
+        result = _HANDLER.dispatch(event_type, payload)
+    except WebhookParseError as e:
+        logger.warning(
+            "Failed to parse webhook",
+            extra={"delivery_id": delivery_id, "error": str(e)},
+        )
+        return 400, {"error": "invalid_payload", "message": str(e)}
+
+    return 200, result
@@ -2,6 +2,12 @@
 
 import hashlib
 import hmac
+from functools import lru_cache
+
+_SIGNATURE_PREFIX = "sha256="
+
+# Length of a well-formed header: the prefix plus a hex SHA-256 digest
+_SIGNATURE_LENGTH = len(_SIGNATURE_PREFIX) + 2 * hashlib.sha256().digest_size
 
 
 class WebhookSignatureError(Exception):
@@ -10,6 +16,19 @@ class WebhookSignatureError(Exception):
     pass
 
 
+@lru_cache(maxsize=4)
+def _secret_key(secret: str) -> bytes:
+    """Encode a webhook secret once for all requests using it.
+
+    Args:
+        secret: The webhook secret.
+
+    Returns:
+        The secret as HMAC key bytes.
+    """
+    return secret.encode()
+
+
 def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> None:
     """Verify the HMAC-SHA256 signature of a webhook payload.
 
@@ -24,10 +43,21 @@ def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> Non
     if not signature:
         raise WebhookSignatureError("Missing signature header")
 
-    if not signature.startswith("sha256="):
+    if not signature.startswith(_SIGNATURE_PREFIX):
         raise WebhookSignatureError("Invalid signature format: must start with 'sha256='")
 
-    expected_signature = "sha256=" + hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+    # Malformed headers are rejected before the (body-sized) HMAC is computed;
+    # the length is public, so this leaks nothing about the secret
+    if len(signature) != _SIGNATURE_LENGTH:
+        raise WebhookSignatureError("Invalid signature format: wrong digest length")
+
+    try:
+        provided_digest = bytes.fromhex(signature[len(_SIGNATURE_PREFIX) :])
+    except ValueError:
+        raise WebhookSignatureError("Invalid signature format: digest is not hex") from None
+
+    # Compare raw digests rather than their hex encodings
+    expected_digest = hmac.new(_secret_key(secret), payload, hashlib.sha256).digest()
 
-    if not hmac.compare_digest(signature, expected_signature):
+    if not hmac.compare_digest(provided_digest, expected_digest):
         raise WebhookSignatureError("Signature verification failed")
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import hmac
 import os
 from typing import TYPE_CHECKING, Any
@@ -16,16 +15,23 @@ if TYPE_CHECKING:
 
 @pytest.fixture(autouse=True)
 def reset_env() -> Generator[None]:
-    """Reset environment variables after each test."""
+    """Reset environment variables after each test.
+
+    Only variables the test added or changed are touched, rather than
+    clearing and re-exporting the whole environment every time.
+    """
     original_env = os.environ.copy()
     yield
-    os.environ.clear()
-    os.environ.update(original_env)
+    for key in os.environ.keys() - original_env.keys():
+        del os.environ[key]
+    for key, value in original_env.items():
+        if os.environ.get(key) != value:
+            os.environ[key] = value
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_env() -> dict[str, str]:
-    """Standard environment variables for testing."""
+    """Standard environment variables for testing (shared; don't mutate)."""
     return {
         "GITHUB_APP_ID": "123456",
         "GITHUB_PRIVATE_KEY": (
@@ -125,5 +131,5 @@ def webhook_signature(mock_env: dict[str, str]) -> str:
     """Generate a valid webhook signature for testing."""
     secret = mock_env["GITHUB_WEBHOOK_SECRET"]
     body = b'{"test": "payload"}'
-    signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    signature = hmac.digest(secret.encode(), body, "sha256").hex()
     return f"sha256={signature}"
@@ -6,13 +6,19 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from app.agent.prompts import build_review_prompt, build_system_prompt
-from app.agent.reviewer import ReviewAgent, ReviewResult
+from app.agent.reviewer import ReviewAgent, ReviewResult, clear_response_cache
 from app.models.comment import Category, CommentType, ReviewComment, Severity
 from app.models.config import AgentConfig
 from app.models.file_diff import FileDiff, FileStatus
 from app.models.pull_request import PullRequest
 
 
+@pytest.fixture(autouse=True)
+def _clear_response_cache() -> None:
+    """Keep cached agent responses from leaking between tests."""
+    clear_response_cache()
+
+
 class TestBuildSystemPrompt:
     """Tests for system prompt building."""
 
@@ -39,6 +45,12 @@ class TestBuildSystemPrompt:
         # Should mention severity concepts
         assert any(term in prompt.lower() for term in ["error", "warning", "info", "severity"])
 
+    def test_system_prompt_is_cached_per_rules(self) -> None:
+        """Test that identical custom rules reuse the same prompt string."""
+        rules = "Never log secrets."
+
+        assert build_system_prompt(custom_rules=rules) is build_system_prompt(custom_rules=rules)
+
 
 class TestBuildReviewPrompt:
     """Tests for review prompt building."""
@@ -120,11 +132,27 @@ class TestReviewAgent:
 
     def test_agent_creation(self, sample_config: AgentConfig) -> None:
         """Test creating a review agent."""
-        with patch("app.agent.reviewer.Agent"):
+        with patch("strands.Agent"):
             agent = ReviewAgent(config=sample_config)
 
             assert agent.config == sample_config
 
+    def test_agent_marks_system_prompt_cacheable(self, sample_config: AgentConfig) -> None:
+        """Test that the system prompt is followed by a Bedrock cache point."""
+        with patch("strands.Agent") as mock_agent_class:
+            agent = ReviewAgent(config=sample_config)
+
+            system_blocks = mock_agent_class.call_args.kwargs["system_prompt"]
+            assert system_blocks[0] == {"text": agent.system_prompt}
+            assert system_blocks[-1] == {"cachePoint": {"type": "default"}}
+
+    def test_agent_does_not_echo_stream(self, sample_config: AgentConfig) -> None:
+        """Test that streamed chunks are not printed by the default handler."""
+        with patch("strands.Agent") as mock_agent_class:
+            ReviewAgent(config=sample_config)
+
+            assert mock_agent_class.call_args.kwargs["callback_handler"] is None
+
     def test_agent_reviews_files(
         self,
         sample_pr: PullRequest,
@@ -132,7 +160,7 @@ class TestReviewAgent:
         sample_files: list[FileDiff],
     ) -> None:
         """Test that agent reviews files and produces results."""
-        with patch("app.agent.reviewer.Agent") as mock_agent_class:
+        with patch("strands.Agent") as mock_agent_class:
             mock_agent = MagicMock()
             mock_agent.return_value = MagicMock(message="Found a potential bug on line 5")
             mock_agent_class.return_value = mock_agent
@@ -145,6 +173,70 @@ class TestReviewAgent:
 
             assert isinstance(result, ReviewResult)
 
+    def test_agent_skips_llm_for_trivial_change(
+        self,
+        sample_pr: PullRequest,
+        sample_config: AgentConfig,
+    ) -> None:
+        """Test that tiny diffs are approved without calling the model."""
+        trivial_file = FileDiff(
+            filename="README.md",
+            status=FileStatus.MODIFIED,
+            additions=1,
+            deletions=1,
+            sha="abc123def456abc123def456abc123def456abc1",
+            patch="@@ -1 +1 @@\n-Teh\n+The",
+        )
+
+        with patch("strands.Agent") as mock_agent_class:
+            agent = ReviewAgent(config=sample_config)
+            result = agent.review_file(pr=sample_pr, file_diff=trivial_file)
+
+            mock_agent_class.return_value.assert_not_called()
+            assert result.skipped is False
+            assert result.summary == "Trivial change"
+            assert result.comments[0].severity == Severity.PRAISE
+
+    def test_agent_reuses_response_for_identical_prompt(
+        self,
+        sample_pr: PullRequest,
+        sample_config: AgentConfig,
+        sample_files: list[FileDiff],
+    ) -> None:
+        """Test that an identical review is served from the response cache."""
+        with patch("strands.Agent") as mock_agent_class:
+            mock_agent = MagicMock()
+            mock_agent.return_value = MagicMock(message="Looks good")
+            mock_agent_class.return_value = mock_agent
+
+            first = ReviewAgent(config=sample_config).review_file(
+                pr=sample_pr, file_diff=sample_files[0]
+            )
+            second = ReviewAgent(config=sample_config).review_file(
+                pr=sample_pr, file_diff=sample_files[0]
+            )
+
+            assert mock_agent.call_count == 1
+            assert first.summary == second.summary == "Looks good"
+
+    def test_agent_bounds_concurrent_invocations(
+        self,
+        sample_pr: PullRequest,
+        sample_config: AgentConfig,
+        sample_files: list[FileDiff],
+    ) -> None:
+        """Test that model calls acquire a process-wide invocation slot."""
+        with (
+            patch("strands.Agent") as mock_agent_class,
+            patch("app.agent.reviewer._invocation_slots") as mock_slots,
+        ):
+            mock_agent_class.return_value.return_value = MagicMock(message="Looks good")
+
+            ReviewAgent(config=sample_config).review_file(pr=sample_pr, file_diff=sample_files[0])
+
+            mock_slots.__enter__.assert_called_once()
+            mock_slots.__exit__.assert_called_once()
+
     def test_agent_handles_binary_files(
         self,
         sample_pr: PullRequest,
@@ -160,7 +252,7 @@ class TestReviewAgent:
             patch=None,  # Binary files have no patch
         )
 
-        with patch("app.agent.reviewer.Agent"):
+        with patch("strands.Agent"):
             agent = ReviewAgent(config=sample_config)
             result = agent.review_file(
                 pr=sample_pr,
@@ -190,7 +282,7 @@ class TestReviewAgent:
         sample_config.excluded_patterns.append("*.lock")
         sample_config.excluded_patterns.append("*-lock.json")
 
-        with patch("app.agent.reviewer.Agent"):
+        with patch("strands.Agent"):
             agent = ReviewAgent(config=sample_config)
             result = agent.review_file(
                 pr=sample_pr,
@@ -198,6 +290,37 @@ class TestReviewAgent:
             )
 
             assert result.skipped is True
+            assert result.skip_reason == "Matches exclusion pattern: *-lock.json"
+
+    @pytest.mark.parametrize(
+        ("filename", "reason"),
+        [
+            ("poetry.lock", "Matches exclusion pattern: *.lock"),
+            ("static/app.min.js", "Matches exclusion pattern: *.min.js"),
+            ("vendor/pkg/mod.go", "Matches exclusion pattern: vendor/**"),
+            ("src/app.js", None),
+        ],
+    )
+    def test_should_skip_file_reports_pattern(
+        self,
+        sample_config: AgentConfig,
+        filename: str,
+        reason: str | None,
+    ) -> None:
+        """Test that extension and glob exclusions report the matching pattern."""
+        file_diff = FileDiff(
+            filename=filename,
+            status=FileStatus.MODIFIED,
+            additions=1,
+            deletions=0,
+            sha="abc123def456abc123def456abc123def456abc1",
+            patch="+changes",
+        )
+
+        with patch("strands.Agent"):
+            agent = ReviewAgent(config=sample_config)
+
+        assert agent._should_skip_file(file_diff) == (reason is not None, reason)
 
     def test_agent_creates_summary(
         self,
@@ -205,7 +328,7 @@ class TestReviewAgent:
         sample_config: AgentConfig,
     ) -> None:
         """Test that agent creates a summary comment."""
-        with patch("app.agent.reviewer.Agent") as mock_agent_class:
+        with patch("strands.Agent") as mock_agent_class:
             mock_agent = MagicMock()
             mock_agent.return_value = MagicMock(message="Overall, good code quality")
             mock_agent_class.return_value = mock_agent
@@ -220,6 +343,55 @@ class TestReviewAgent:
             assert isinstance(summary, str)
 
 
+class TestParseReviewResponse:
+    """Tests for classifying agent responses into comments."""
+
+    @pytest.fixture
+    def agent(self) -> ReviewAgent:
+        """Create a review agent with a mocked Strands agent."""
+        with patch("strands.Agent"):
+            return ReviewAgent(config=AgentConfig.default())
+
+    @pytest.mark.parametrize(
+        ("response", "severity", "category"),
+        [
+            ("Consider renaming this variable.", Severity.INFO, Category.BEST_PRACTICE),
+            ("This introduces a Bug in the loop.", Severity.WARNING, Category.BUG),
+            ("SQL injection is a security risk.", Severity.ERROR, Category.SECURITY),
+            ("Critical performance regression.", Severity.ERROR, Category.PERFORMANCE),
+            ("Good use of typing; style is consistent.", Severity.PRAISE, Category.STYLE),
+        ],
+    )
+    def test_classifies_response(
+        self,
+        agent: ReviewAgent,
+        response: str,
+        severity: Severity,
+        category: Category,
+    ) -> None:
+        """Test severity and category detection from response keywords."""
+        comments = agent._parse_review_response(response, "test.py")
+
+        assert len(comments) == 1
+        assert comments[0].severity == severity
+        assert comments[0].category == category
+        assert comments[0].comment_type == CommentType.SUMMARY
+
+    def test_classification_ignores_keywords_past_window(self, agent: ReviewAgent) -> None:
+        """Test that only the head of a long response is classified."""
+        response = "Consider renaming this variable. " + " " * 4096 + "security bug"
+
+        comments = agent._parse_review_response(response, "test.py")
+
+        assert comments[0].severity == Severity.INFO
+        assert comments[0].category == Category.BEST_PRACTICE
+        assert comments[0].body == response
+
+    def test_empty_response_yields_no_comments(self, agent: ReviewAgent) -> None:
+        """Test that a blank response produces no comments."""
+        assert agent._parse_review_response("   \n", "test.py") == []
+
+
 class TestReviewResult:
     """Tests for ReviewResult data class."""
 
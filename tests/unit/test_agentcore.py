@@ -1,6 +1,7 @@
 """Unit tests for AgentCore entrypoint."""
 
-import hashlib
+import base64
+import functools
 import hmac
 import json
 import os
@@ -9,6 +10,48 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+# Webhook secret shared by the webhook tests
+_WEBHOOK_SECRET = "test-webhook-secret"
+
+# Compact separators, so webhook bodies (and the bytes signed) stay small
+_JSON_SEP = (",", ":")
+
+
+@functools.lru_cache(maxsize=64)
+def _sign(body: bytes, secret: bytes) -> str:
+    """Compute the X-Hub-Signature-256 value for a body, once per body."""
+    return "sha256=" + hmac.digest(secret, body, "sha256").hex()
+
+
+@pytest.fixture(scope="module")
+def webhook_secret() -> str:
+    """Webhook secret for testing."""
+    return _WEBHOOK_SECRET
+
+
+@pytest.fixture(autouse=True)
+def _clear_agent_pool() -> None:
+    """Keep pooled review agents from leaking between tests."""
+    from app.agentcore import _AGENT_POOL  # noqa: PLC0415
+
+    _AGENT_POOL.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_github_clients() -> None:
+    """Keep cached GitHub clients from leaking between tests."""
+    from app.tools.github import clear_client_cache  # noqa: PLC0415
+
+    clear_client_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_seen_deliveries() -> None:
+    """Keep webhook delivery de-duplication from leaking between tests."""
+    from app.agentcore import _SEEN_DELIVERIES  # noqa: PLC0415
+
+    _SEEN_DELIVERIES.clear()
+
 
 class TestAgentCoreApp:
     """Tests for the AgentCore application setup."""
@@ -58,6 +101,7 @@ class TestInvokeEntrypoint:
                 "author": "testuser",
                 "base_branch": "main",
                 "head_branch": "feature",
+                "head_sha": "abc123def456abc123def456abc123def456abc1",
             }
             mock_list_files.return_value = []
 
@@ -76,7 +120,7 @@ class TestInvokeEntrypoint:
 
     def test_invoke_with_prompt_only(self) -> None:
         """Test invoke with just a prompt (no PR context)."""
-        with patch("app.agentcore.Agent") as mock_agent_class:
+        with patch("strands.Agent") as mock_agent_class:
             mock_agent = MagicMock()
             mock_agent.return_value = MagicMock(message="Hello! How can I help?")
             mock_agent_class.return_value = mock_agent
@@ -114,6 +158,7 @@ class TestInvokeEntrypoint:
                 "author": "testuser",
                 "base_branch": "main",
                 "head_branch": "feature",
+                "head_sha": "abc123def456abc123def456abc123def456abc1",
                 "files_changed": 1,
                 "additions": 10,
                 "deletions": 5,
@@ -144,9 +189,27 @@ class TestInvokeEntrypoint:
             # Should contain review summary
             assert "summary" in result or "result" in result
 
+    async def test_invoke_streams_general_query(self) -> None:
+        """Test that stream=True yields the answer chunk by chunk."""
+
+        async def fake_stream(prompt: str) -> Any:
+            del prompt
+            for event in ({"init_event_loop": True}, {"data": "Hel"}, {"data": "lo"}):
+                yield event
+
+        with patch("strands.Agent") as mock_agent_class:
+            mock_agent_class.return_value.stream_async = fake_stream
+
+            from app.agentcore import invoke  # noqa: PLC0415
+
+            result = invoke({"prompt": "Hello", "stream": True})
+
+            assert not isinstance(result, dict)
+            assert [chunk async for chunk in result] == ["Hel", "lo"]
+
     def test_invoke_handles_missing_prompt(self) -> None:
         """Test invoke with missing prompt uses default."""
-        with patch("app.agentcore.Agent") as mock_agent_class:
+        with patch("strands.Agent") as mock_agent_class:
             mock_agent = MagicMock()
             mock_agent.return_value = MagicMock(message="Default response")
             mock_agent_class.return_value = mock_agent
@@ -160,7 +223,7 @@ class TestInvokeEntrypoint:
 
     def test_invoke_handles_error(self) -> None:
         """Test invoke handles errors gracefully."""
-        with patch("app.agentcore.Agent") as mock_agent_class:
+        with patch("strands.Agent") as mock_agent_class:
             mock_agent = MagicMock()
             mock_agent.side_effect = Exception("Agent error")
             mock_agent_class.return_value = mock_agent
@@ -226,6 +289,7 @@ class TestReviewPR:
                 "author": "testuser",
                 "base_branch": "main",
                 "head_branch": "feature",
+                "head_sha": "abc123def456abc123def456abc123def456abc1",
             }
             mock_list_files.return_value = []
 
@@ -240,15 +304,267 @@ class TestReviewPR:
             assert "summary" in result
             assert "files_reviewed" in result
 
+    def test_review_pr_preserves_file_order(self) -> None:
+        """Test that concurrently reviewed files are reported in PR order."""
+        with (
+            patch("app.agentcore.ReviewAgent") as mock_agent_class,
+            patch("app.agentcore.create_github_client"),
+            patch("app.agentcore.get_pr_metadata") as mock_get_metadata,
+            patch("app.agentcore.list_pr_files") as mock_list_files,
+        ):
+            mock_agent = MagicMock()
+            mock_agent.review_file.side_effect = lambda pr, file_diff: MagicMock(  # noqa: ARG005
+                file_path=file_diff.filename,
+                comments=[],
+                skipped=False,
+            )
+            mock_agent.create_summary.return_value = "Review complete"
+            mock_agent_class.return_value = mock_agent
+
+            mock_get_metadata.return_value = {
+                "title": "Test",
+                "body": "",
+                "author": "testuser",
+                "base_branch": "main",
+                "head_branch": "feature",
+                "head_sha": "abc123def456abc123def456abc123def456abc1",
+            }
+            filenames = [f"src/module_{i}.py" for i in range(5)]
+            mock_list_files.return_value = [
+                {
+                    "filename": name,
+                    "status": "modified",
+                    "additions": 1,
+                    "deletions": 1,
+                    "sha": "abc123def456abc123def456abc123def456abc1",
+                    "patch": "+change",
+                }
+                for name in filenames
+            ]
+
+            from app.agentcore import review_pr  # noqa: PLC0415
+
+            result = review_pr(
+                repository="owner/repo",
+                pr_number=42,
+                installation_id=12345,
+            )
+
+            assert [f["file_path"] for f in result["files_reviewed"]] == filenames
+
+    def test_review_pr_skips_excluded_files_without_review(self) -> None:
+        """Test that excluded files are reported as skipped and never reviewed."""
+        with (
+            patch("app.agentcore.ReviewAgent") as mock_agent_class,
+            patch("app.agentcore.create_github_client"),
+            patch("app.agentcore.get_pr_metadata") as mock_get_metadata,
+            patch("app.agentcore.list_pr_files") as mock_list_files,
+        ):
+            mock_agent = MagicMock()
+            mock_agent.review_file.side_effect = lambda pr, file_diff: MagicMock(  # noqa: ARG005
+                file_path=file_diff.filename,
+                comments=[],
+                skipped=False,
+            )
+            mock_agent.create_summary.return_value = "Review complete"
+            mock_agent_class.return_value = mock_agent
+
+            mock_get_metadata.return_value = {
+                "title": "Test",
+                "body": "",
+                "author": "testuser",
+                "base_branch": "main",
+                "head_branch": "feature",
+                "head_sha": "abc123def456abc123def456abc123def456abc1",
+            }
+            filenames = ["src/app.py", "uv.lock", "node_modules/pkg/index.js", "README.md"]
+            mock_list_files.return_value = [
+                {
+                    "filename": name,
+                    "status": "modified",
+                    "additions": 5,
+                    "deletions": 1,
+                    "sha": "abc123def456abc123def456abc123def456abc1",
+                    "patch": "+change",
+                }
+                for name in filenames
+            ]
+
+            from app.agentcore import review_pr  # noqa: PLC0415
+
+            result = review_pr(
+                repository="owner/repo",
+                pr_number=42,
+                installation_id=12345,
+            )
+
+            reviewed = [
+                call.kwargs["file_diff"].filename for call in mock_agent.review_file.call_args_list
+            ]
+            assert sorted(reviewed) == ["README.md", "src/app.py"]
+            assert [f["file_path"] for f in result["files_reviewed"]] == filenames
+            assert [f["skipped"] for f in result["files_reviewed"]] == [False, True, True, False]
+            assert result["total_files"] == 4
+            assert result["files_skipped"] == 2
+
+    def test_review_pr_enforces_max_files(self) -> None:
+        """Test that only the smallest max_files files are sent for review."""
+        from app.models.config import AgentConfig  # noqa: PLC0415
+
+        with (
+            patch("app.agentcore.ReviewAgent") as mock_agent_class,
+            patch("app.agentcore.create_github_client"),
+            patch("app.agentcore.get_pr_metadata") as mock_get_metadata,
+            patch("app.agentcore.list_pr_files") as mock_list_files,
+            patch("app.agentcore.AgentConfig") as mock_config_class,
+        ):
+            mock_config_class.default.return_value = AgentConfig(max_files=2)
+
+            mock_agent = MagicMock()
+            mock_agent.review_file.side_effect = lambda pr, file_diff: MagicMock(  # noqa: ARG005
+                file_path=file_diff.filename,
+                comments=[],
+                skipped=False,
+            )
+            mock_agent.create_summary.return_value = "Review complete"
+            mock_agent_class.return_value = mock_agent
+
+            mock_get_metadata.return_value = {
+                "title": "Test",
+                "body": "",
+                "author": "testuser",
+                "base_branch": "main",
+                "head_branch": "feature",
+                "head_sha": "abc123def456abc123def456abc123def456abc1",
+            }
+            sizes = {"src/big.py": 300, "src/small.py": 3, "src/medium.py": 40}
+            mock_list_files.return_value = [
+                {
+                    "filename": name,
+                    "status": "modified",
+                    "additions": size,
+                    "deletions": 0,
+                    "sha": "abc123def456abc123def456abc123def456abc1",
+                    "patch": "+change",
+                }
+                for name, size in sizes.items()
+            ]
+
+            from app.agentcore import review_pr  # noqa: PLC0415
+
+            result = review_pr(
+                repository="owner/repo",
+                pr_number=42,
+                installation_id=12345,
+            )
+
+            assert mock_agent.review_file.call_count == 2
+            assert result["files_skipped_due_to_limit"] == 1
+            assert [f["file_path"] for f in result["files_reviewed"]] == list(sizes)
+            assert result["files_reviewed"][0]["skipped"] is True
+            assert "max_files" in result["files_reviewed"][0]["skip_reason"]
+
+    def test_review_pr_uses_head_sha_from_metadata(self) -> None:
+        """Test that the reviewed PR carries the real head SHA."""
+        with (
+            patch("app.agentcore.ReviewAgent") as mock_agent_class,
+            patch("app.agentcore.create_github_client"),
+            patch("app.agentcore.get_pr_metadata") as mock_get_metadata,
+            patch("app.agentcore.list_pr_files") as mock_list_files,
+        ):
+            mock_agent_class.return_value.create_summary.return_value = "Review complete"
+            mock_get_metadata.return_value = {
+                "title": "Test",
+                "body": "",
+                "author": "testuser",
+                "base_branch": "main",
+                "head_branch": "feature",
+                "head_sha": "0123456789abcdef0123456789abcdef01234567",
+                "html_url": "https://github.com/owner/repo/pull/42",
+            }
+            mock_list_files.return_value = []
+
+            from app.agentcore import review_pr  # noqa: PLC0415
+
+            review_pr(repository="owner/repo", pr_number=42, installation_id=12345)
+
+            pr = mock_agent_class.return_value.create_summary.call_args.kwargs["pr"]
+            assert pr.head_sha == "0123456789abcdef0123456789abcdef01234567"
+            mock_list_files.assert_called_once()
+
+    def test_review_pr_from_model_skips_metadata_fetch(
+        self, sample_pr_payload: dict[str, Any]
+    ) -> None:
+        """Test that webhook reviews reuse the payload's PR details."""
+        from app.models.pull_request import PullRequest  # noqa: PLC0415
+
+        pr = PullRequest.from_webhook_payload(sample_pr_payload)
+        with (
+            patch("app.agentcore.ReviewAgent") as mock_agent_class,
+            patch("app.agentcore.create_github_client"),
+            patch("app.agentcore.get_pr_metadata") as mock_get_metadata,
+            patch("app.agentcore.list_pr_files", return_value=[]) as mock_list_files,
+        ):
+            from app.agentcore import review_pr_from_model  # noqa: PLC0415
+
+            review_pr_from_model(pr)
+
+        mock_get_metadata.assert_not_called()
+        mock_list_files.assert_called_once()
+        assert mock_list_files.call_args.kwargs["head_sha"] == pr.head_sha
+        assert mock_agent_class.return_value.create_summary.call_args.kwargs["pr"] is pr
+
+    def test_review_pr_from_model_posts_results(self, sample_pr_payload: dict[str, Any]) -> None:
+        """Test that a review can be posted to the PR it came from."""
+        from app.models.pull_request import PullRequest  # noqa: PLC0415
+
+        pr = PullRequest.from_webhook_payload(sample_pr_payload)
+        with (
+            patch("app.agentcore.ReviewAgent") as mock_agent_class,
+            patch("app.agentcore.create_github_client"),
+            patch("app.agentcore.list_pr_files", return_value=[]),
+            patch("app.agentcore.post_comments", return_value={"errors": []}) as mock_post,
+        ):
+            mock_agent_class.return_value.create_summary.return_value = "Review complete"
+
+            from app.agentcore import review_pr_from_model  # noqa: PLC0415
+
+            result = review_pr_from_model(pr, post_results=True)
+
+        assert result["posting"] == {"errors": []}
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["commit_id"] == pr.head_sha
+        assert [c.body for c in kwargs["comments"]] == ["Review complete"]
+
+    def test_review_pr_reuses_review_agent(self) -> None:
+        """Test that repeated reviews with the same config share one agent."""
+        with patch("app.agentcore.ReviewAgent") as mock_agent_class:
+            mock_agent_class.return_value.create_summary.return_value = "Review complete"
+
+            from app.agentcore import review_pr  # noqa: PLC0415
+
+            review_pr(repository="owner/repo", pr_number=1)
+            review_pr(repository="owner/repo", pr_number=2)
+
+            mock_agent_class.assert_called_once()
+
+    def test_review_agent_pool_keys_on_min_review_changes(self) -> None:
+        """Test that configs differing only in min_review_changes get separate agents."""
+        from app.agentcore import _get_review_agent  # noqa: PLC0415
+        from app.models.config import AgentConfig  # noqa: PLC0415
+
+        with patch("app.agentcore.ReviewAgent", side_effect=MagicMock):
+            strict = _get_review_agent(AgentConfig(min_review_changes=0))
+            lenient = _get_review_agent(AgentConfig(min_review_changes=10))
+
+        assert strict is not lenient
+        assert strict.config.min_review_changes == 0
+        assert lenient.config.min_review_changes == 10
+
 
 class TestHandleWebhook:
     """Tests for the handle_webhook function."""
 
-    @pytest.fixture
-    def webhook_secret(self) -> str:
-        """Webhook secret for testing."""
-        return "test-webhook-secret"
-
     @pytest.fixture
     def set_webhook_env(self, webhook_secret: str) -> None:
         """Set webhook environment variables."""
@@ -256,8 +572,7 @@ class TestHandleWebhook:
 
     def _create_signature(self, body: bytes, secret: str) -> str:
         """Create a valid webhook signature."""
-        signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
-        return f"sha256={signature}"
+        return _sign(body, secret.encode())
 
     def test_handle_webhook_function_exists(self) -> None:
         """Test that the handle_webhook function exists."""
@@ -297,6 +612,26 @@ class TestHandleWebhook:
         assert result["status_code"] == 403
         assert result["error"] == "invalid_signature"
 
+    def test_handle_webhook_ignores_unhandled_event_before_verification(
+        self, set_webhook_env: None
+    ) -> None:
+        """Test that unhandled events are ignored without checking the signature."""
+        del set_webhook_env  # fixture activates env var
+        from app.agentcore import handle_webhook  # noqa: PLC0415
+
+        with patch("app.webhook.pipeline.verify_webhook_signature") as mock_verify:
+            result = handle_webhook(
+                body=b'{"ref": "refs/heads/main"}',
+                signature="sha256=invalid",
+                event_type="push",
+                delivery_id="test-123",
+            )
+
+            mock_verify.assert_not_called()
+
+        assert result["status_code"] == 200
+        assert result["status"] == "ignored"
+
     def test_handle_webhook_invalid_json(self, set_webhook_env: None, webhook_secret: str) -> None:
         """Test webhook handling with invalid JSON payload."""
         del set_webhook_env  # fixture activates env var
@@ -321,7 +656,7 @@ class TestHandleWebhook:
         from app.agentcore import handle_webhook  # noqa: PLC0415
 
         payload = {"zen": "Keep it simple", "hook_id": 123}
-        body = json.dumps(payload).encode()
+        body = json.dumps(payload, separators=_JSON_SEP).encode()
         signature = self._create_signature(body, webhook_secret)
 
         result = handle_webhook(
@@ -362,6 +697,7 @@ class TestHandleWebhook:
                 "author": "testuser",
                 "base_branch": "main",
                 "head_branch": "feature",
+                "head_sha": "abc123def456abc123def456abc123def456abc1",
             }
             mock_list_files.return_value = []
 
@@ -387,9 +723,36 @@ class TestHandleWebhook:
                 "repository": {"full_name": "owner/repo"},
                 "installation": {"id": 12345},
             }
-            body = json.dumps(payload).encode()
+            body = json.dumps(payload, separators=_JSON_SEP).encode()
             signature = self._create_signature(body, webhook_secret)
 
+            with patch("app.agentcore._REVIEW_EXECUTOR") as mock_executor:
+                result = handle_webhook(
+                    body=body,
+                    signature=signature,
+                    event_type="pull_request",
+                    delivery_id="test-123",
+                )
+
+                # The review runs in the background; the response doesn't wait on it
+                mock_executor.submit.assert_called_once()
+                mock_agent.review_file.assert_not_called()
+
+            assert result["status_code"] == 202
+            assert result["status"] == "queued"
+            assert "review" not in result
+
+    def test_handle_webhook_pr_closed_does_not_queue_review(
+        self, set_webhook_env: None, webhook_secret: str
+    ) -> None:
+        """Test that PR actions outside the review set are acknowledged and ignored."""
+        del set_webhook_env  # fixture activates env var
+        from app.agentcore import handle_webhook  # noqa: PLC0415
+
+        body = json.dumps({"action": "closed", "number": 42}, separators=_JSON_SEP).encode()
+        signature = self._create_signature(body, webhook_secret)
+
+        with patch("app.agentcore._REVIEW_EXECUTOR") as mock_executor:
             result = handle_webhook(
                 body=body,
                 signature=signature,
@@ -397,19 +760,103 @@ class TestHandleWebhook:
                 delivery_id="test-123",
             )
 
-            assert result["status_code"] == 202
-            assert result["status"] == "queued"
-            assert "review" in result
+            mock_executor.submit.assert_not_called()
+
+        assert result["status_code"] == 200
+        assert result["status"] == "ignored"
+        assert "closed" in result["message"]
+
+    def test_handle_webhook_ignores_duplicate_delivery(
+        self, set_webhook_env: None, webhook_secret: str
+    ) -> None:
+        """Test that a redelivered PR event is queued only once."""
+        del set_webhook_env  # fixture activates env var
+        from app.agentcore import handle_webhook  # noqa: PLC0415
+
+        payload = {
+            "action": "synchronize",
+            "number": 42,
+            "pull_request": {
+                "title": "Test PR",
+                "body": None,
+                "user": {"login": "testuser"},
+                "head": {
+                    "ref": "feature",
+                    "sha": "abc123def456abc123def456abc123def456abc1",
+                },
+                "base": {"ref": "main"},
+                "html_url": "https://github.com/owner/repo/pull/42",
+                "changed_files": 1,
+                "additions": 10,
+                "deletions": 5,
+            },
+            "repository": {"full_name": "owner/repo"},
+            "installation": {"id": 12345},
+        }
+        body = json.dumps(payload, separators=_JSON_SEP).encode()
+        signature = self._create_signature(body, webhook_secret)
+
+        with patch("app.agentcore._REVIEW_EXECUTOR") as mock_executor:
+            first = handle_webhook(
+                body=body,
+                signature=signature,
+                event_type="pull_request",
+                delivery_id="delivery-1",
+            )
+            second = handle_webhook(
+                body=body,
+                signature=signature,
+                event_type="pull_request",
+                delivery_id="delivery-1",
+            )
+
+            mock_executor.submit.assert_called_once()
+
+        assert first["status_code"] == 202
+        assert second["status_code"] == 200
+        assert second["status"] == "duplicate"
+
+    def test_background_review_reports_busy_while_running(self) -> None:
+        """Test that ping reports busy until the background review completes."""
+        from bedrock_agentcore.runtime import PingStatus  # noqa: PLC0415
+
+        from app.agentcore import _run_background_review, ping  # noqa: PLC0415
+
+        statuses: list[PingStatus] = []
+
+        def fake_review(pr: Any, *, post_results: bool) -> dict[str, Any]:
+            del pr, post_results
+            statuses.append(ping())
+            return {"total_comments": 0}
+
+        with patch("app.agentcore.review_pr_from_model", side_effect=fake_review):
+            _run_background_review(MagicMock(repository="owner/repo", number=42), "test-123")
+
+        assert statuses == [PingStatus.HEALTHY_BUSY]
+        assert ping() == PingStatus.HEALTHY
+
+    def test_background_review_posts_and_reports_errors(self) -> None:
+        """Test that background reviews are posted and failed ones logged as errors."""
+        from app.agentcore import _run_background_review  # noqa: PLC0415
+
+        pr = MagicMock(repository="owner/repo", number=42)
+        with (
+            patch(
+                "app.agentcore.review_pr_from_model",
+                return_value={"error": "boom", "total_comments": 0},
+            ) as mock_review,
+            patch("app.agentcore.logger") as mock_logger,
+        ):
+            _run_background_review(pr, "test-123")
+
+        mock_review.assert_called_once_with(pr, post_results=True)
+        mock_logger.info.assert_not_called()
+        assert mock_logger.error.call_args.kwargs["extra"]["errors"] == ["boom"]
 
 
 class TestInvokeWithWebhook:
     """Tests for invoke function with webhook payload."""
 
-    @pytest.fixture
-    def webhook_secret(self) -> str:
-        """Webhook secret for testing."""
-        return "test-webhook-secret"
-
     @pytest.fixture
     def set_webhook_env(self, webhook_secret: str) -> None:
         """Set webhook environment variables."""
@@ -417,8 +864,7 @@ class TestInvokeWithWebhook:
 
     def _create_signature(self, body: bytes, secret: str) -> str:
         """Create a valid webhook signature."""
-        signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
-        return f"sha256={signature}"
+        return _sign(body, secret.encode())
 
     def test_invoke_with_webhook_body(self, set_webhook_env: None, webhook_secret: str) -> None:
         """Test invoke with webhook payload."""
@@ -426,7 +872,7 @@ class TestInvokeWithWebhook:
         from app.agentcore import invoke  # noqa: PLC0415
 
         webhook_payload = {"zen": "Keep it simple", "hook_id": 123}
-        body = json.dumps(webhook_payload).encode()
+        body = json.dumps(webhook_payload, separators=_JSON_SEP).encode()
         signature = self._create_signature(body, webhook_secret)
 
         result = invoke(
@@ -440,3 +886,43 @@ class TestInvokeWithWebhook:
 
         assert result["status_code"] == 200
         assert result["status"] == "ok"
+
+    def test_invoke_with_base64_webhook_body(
+        self, set_webhook_env: None, webhook_secret: str
+    ) -> None:
+        """Test that base64-encoded webhook bodies are decoded before verification."""
+        del set_webhook_env  # fixture activates env var
+        from app.agentcore import invoke  # noqa: PLC0415
+
+        body = json.dumps({"zen": "Keep it simple", "hook_id": 123}, separators=_JSON_SEP).encode()
+        signature = self._create_signature(body, webhook_secret)
+
+        result = invoke(
+            {
+                "webhook_body": base64.b64encode(body).decode(),
+                "webhook_is_base64_encoded": True,
+                "webhook_signature": signature,
+                "webhook_event_type": "ping",
+                "webhook_delivery_id": "test-123",
+            }
+        )
+
+        assert result["status_code"] == 200
+        assert result["status"] == "ok"
+
+    def test_invoke_rejects_malformed_base64_body(self) -> None:
+        """Test that a malformed base64 body is rejected as an invalid payload."""
+        from app.agentcore import invoke  # noqa: PLC0415
+
+        result = invoke(
+            {
+                "webhook_body": "not base64!",
+                "webhook_is_base64_encoded": True,
+                "webhook_signature": "sha256=invalid",
+                "webhook_event_type": "ping",
+                "webhook_delivery_id": "test-123",
+            }
+        )
+
+        assert result["status_code"] == 400
+        assert result["error"] == "invalid_payload"
@@ -0,0 +1,150 @@
+"""Unit tests for comment posting tools."""
+
+from unittest.mock import MagicMock, patch
+
+from github.GithubObject import NotSet
+
+from app.models.comment import Category, CommentType, LineSide, ReviewComment, Severity
+from app.tools.comments import (
+    CommentPostError,
+    create_review,
+    post_comments,
+    post_summary_comment,
+)
+
+
+def _summary(body: str) -> ReviewComment:
+    """Build a summary comment."""
+    return ReviewComment(
+        body=body,
+        comment_type=CommentType.SUMMARY,
+        severity=Severity.INFO,
+        category=Category.BEST_PRACTICE,
+    )
+
+
+class TestPostingRequests:
+    """Tests that posting goes through lazy handles."""
+
+    def test_summary_comment_posts_on_lazy_issue(self) -> None:
+        """Test that a summary comment is posted without fetching the repo or PR."""
+        client = MagicMock()
+        lazy_repo = client.withLazy.return_value.get_repo.return_value
+        lazy_repo.get_issue.return_value.create_comment.return_value = MagicMock(
+            id=7, html_url="https://github.com/owner/repo/pull/42#issuecomment-7"
+        )
+
+        result = post_summary_comment(client, 42, "owner/repo", "Looks good")
+
+        client.withLazy.assert_called_once_with(True)
+        client.get_repo.assert_not_called()
+        lazy_repo.get_issue.assert_called_once_with(42)
+        lazy_repo.get_issue.return_value.create_comment.assert_called_once_with(body="Looks good")
+        assert result["id"] == 7
+
+    def test_review_without_commit_leaves_head_to_github(self) -> None:
+        """Test that a review without commit_id does not read the PR head."""
+        client = MagicMock()
+        lazy_repo = client.withLazy.return_value.get_repo.return_value
+        pr = lazy_repo.get_pull.return_value
+        pr.create_review.return_value = MagicMock(id=1, state="COMMENTED", html_url="u")
+
+        create_review(client, 42, "owner/repo", "Summary")
+
+        lazy_repo.get_commit.assert_not_called()
+        assert pr.create_review.call_args.kwargs["commit"] is NotSet
+        assert pr.create_review.call_args.kwargs["body"] == "Summary"
+
+    def test_review_comments_keep_only_api_fields(self) -> None:
+        """Test that inline comments are trimmed to the fields GitHub accepts."""
+        client = MagicMock()
+        pr = client.withLazy.return_value.get_repo.return_value.get_pull.return_value
+        pr.create_review.return_value = MagicMock(id=1, state="COMMENTED", html_url="u")
+
+        create_review(
+            client,
+            42,
+            "owner/repo",
+            "Summary",
+            comments=[
+                {"path": "a.py", "line": 3, "body": "Fix", "side": "RIGHT", "severity": "x"},
+                {"path": "b.py", "line": 9, "body": "Nit"},
+            ],
+        )
+
+        assert pr.create_review.call_args.kwargs["comments"] == [
+            {"path": "a.py", "line": 3, "body": "Fix", "side": "RIGHT"},
+            {"path": "b.py", "line": 9, "body": "Nit"},
+        ]
+
+
+class TestPostComments:
+    """Tests for batched comment posting."""
+
+    def test_summaries_ride_along_with_review(self) -> None:
+        """Test that summaries become the review body instead of separate posts."""
+        inline = ReviewComment(
+            body="Possible None",
+            comment_type=CommentType.INLINE,
+            severity=Severity.WARNING,
+            category=Category.BUG,
+            file_path="src/main.py",
+            line=3,
+            side=LineSide.RIGHT,
+        )
+
+        with (
+            patch("app.tools.comments.create_review") as mock_review,
+            patch("app.tools.comments.post_summary_comment") as mock_summary,
+        ):
+            results = post_comments(
+                MagicMock(), 42, "owner/repo", [_summary("First"), inline, _summary("Second")]
+            )
+
+        mock_summary.assert_not_called()
+        mock_review.assert_called_once()
+        body = mock_review.call_args.kwargs["body"]
+        assert body.startswith("## Code Review Results")
+        assert "First\n\n---\n\nSecond" in body
+        assert results == {"inline_posted": 1, "summary_posted": 2, "errors": []}
+
+    def test_summaries_survive_rejected_review(self) -> None:
+        """Test that summaries fall back to an issue comment when the review fails."""
+        inline = ReviewComment(
+            body="Possible None",
+            comment_type=CommentType.INLINE,
+            severity=Severity.WARNING,
+            category=Category.BUG,
+            file_path="src/main.py",
+            line=300,
+            side=LineSide.RIGHT,
+        )
+
+        with (
+            patch(
+                "app.tools.comments.create_review",
+                side_effect=CommentPostError("line outside the diff"),
+            ),
+            patch("app.tools.comments.post_summary_comment") as mock_summary,
+        ):
+            results = post_comments(MagicMock(), 42, "owner/repo", [_summary("First"), inline])
+
+        assert mock_summary.call_args.kwargs["body"] == "First"
+        assert results["inline_posted"] == 0
+        assert results["summary_posted"] == 1
+        assert len(results["errors"]) == 1
+
+    def test_summaries_only_post_one_comment(self) -> None:
+        """Test that summaries without inline comments are joined into one post."""
+        with (
+            patch("app.tools.comments.create_review") as mock_review,
+            patch("app.tools.comments.post_summary_comment") as mock_summary,
+        ):
+            results = post_comments(
+                MagicMock(), 42, "owner/repo", [_summary("First"), _summary("Second")]
+            )
+
+        mock_review.assert_not_called()
+        mock_summary.assert_called_once()
+        assert mock_summary.call_args.kwargs["body"] == "First\n\n---\n\nSecond"
+        assert results["summary_posted"] == 2
@@ -1,12 +1,20 @@
 """Unit tests for configuration."""
 
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from app.models.config import SUPPORTED_MODELS, AgentConfig
-from app.utils.config_loader import ConfigLoaderError, load_repo_config
+from app.models.config import DEFAULT_EXCLUDED, SUPPORTED_MODELS, AgentConfig
+from app.utils.config_loader import ConfigLoaderError, clear_config_cache, load_repo_config
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache() -> None:
+    """Keep cached configs from leaking between tests."""
+    clear_config_cache()
 
 
 class TestAgentConfig:
@@ -82,6 +90,20 @@ class TestAgentConfig:
         config_high = AgentConfig(temperature=1.0)
         assert config_high.temperature == 1.0
 
+    def test_max_parallel_validation(self) -> None:
+        """Test max_parallel validation."""
+        with pytest.raises(ValueError, match="max_parallel"):
+            AgentConfig(max_parallel=0)
+
+        assert AgentConfig(max_parallel=1).max_parallel == 1
+
+    def test_min_review_changes_validation(self) -> None:
+        """Test min_review_changes validation."""
+        with pytest.raises(ValueError, match="min_review_changes"):
+            AgentConfig(min_review_changes=-1)
+
+        assert AgentConfig(min_review_changes=0).min_review_changes == 0
+
     def test_from_repo_config(self) -> None:
         """Test creating config from repository config dict."""
         repo_config = {
@@ -117,6 +139,14 @@ class TestAgentConfig:
         assert "*.lock" in config.excluded_patterns
         assert "node_modules/**" in config.excluded_patterns
 
+    def test_excluded_patterns_default_is_independent_copy(self) -> None:
+        """Test that editing one config's patterns leaves the defaults intact."""
+        config = AgentConfig.default()
+        config.excluded_patterns.append("*.generated.ts")
+
+        assert "*.generated.ts" not in AgentConfig.default().excluded_patterns
+        assert "*.generated.ts" not in DEFAULT_EXCLUDED
+
     def test_custom_excluded_patterns(self) -> None:
         """Test custom excluded patterns."""
         custom_patterns = ["*.test.js", "coverage/**"]
@@ -124,6 +154,29 @@ class TestAgentConfig:
 
         assert config.excluded_patterns == custom_patterns
 
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("poetry.lock", True),
+            ("static/app.min.js", True),
+            ("vendor/lib/mod.go", True),
+            ("node_modules/pkg/index.js", True),
+            ("src/main.py", False),
+            ("docs/build.md", False),
+        ],
+    )
+    def test_is_excluded(self, path: str, expected: bool) -> None:
+        """Test matching paths against the default exclusion patterns."""
+        assert AgentConfig.default().is_excluded(path) is expected
+
+    def test_excluded_matcher_reports_pattern(self) -> None:
+        """Test that the matcher names the pattern a path matched."""
+        config = AgentConfig(excluded_patterns=["*.lock", "generated/**"])
+
+        assert config.excluded_matcher("uv.lock") == "*.lock"
+        assert config.excluded_matcher("generated/api.py") == "generated/**"
+        assert config.excluded_matcher("src/api.py") is None
+
 
 class TestLoadRepoConfig:
     """Tests for repository configuration loading."""
@@ -206,3 +259,41 @@ enable_rereview: false
 
             # .yml should take precedence
             assert config.model_id == "amazon.nova-pro-v1:0"
+
+    def test_utf8_config(self, tmp_path: Path) -> None:
+        """Test that non-ASCII config values are read as UTF-8."""
+        (tmp_path / ".reviewbot.yml").write_text(
+            "excluded_patterns:\n  - 'docs/日本語/*'\n", encoding="utf-8"
+        )
+
+        config = load_repo_config(tmp_path)
+
+        assert config.excluded_patterns == ["docs/日本語/*"]
+
+    def test_unchanged_config_is_parsed_once(self, tmp_path: Path) -> None:
+        """Test that an unchanged file is served from cache as an independent copy."""
+        from app.utils import config_loader  # noqa: PLC0415
+
+        (tmp_path / ".reviewbot.yml").write_text("excluded_patterns:\n  - '*.lock'\n")
+
+        with patch.object(
+            config_loader, "_load_yaml_file", wraps=config_loader._load_yaml_file
+        ) as mock_load:
+            first = load_repo_config(tmp_path)
+            first.excluded_patterns.append("*.tmp")
+            second = load_repo_config(tmp_path)
+
+        mock_load.assert_called_once()
+        assert second.excluded_patterns == ["*.lock"]
+
+    def test_modified_config_is_reparsed(self, tmp_path: Path) -> None:
+        """Test that a change to the file's mtime or size invalidates the cache."""
+        config_file = tmp_path / ".reviewbot.yml"
+        config_file.write_text("timeout: 300\n")
+        assert load_repo_config(tmp_path).timeout_seconds == 300
+
+        config_file.write_text("timeout: 120\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_repo_config(tmp_path).timeout_seconds == 120
@@ -1,10 +1,13 @@
 """Unit tests for diff parsing utilities."""
 
+import pytest
+
 from app.tools.diff import (
     ChangedLine,
     DiffHunk,
     LineChangeType,
     extract_changed_lines,
+    get_line_at_position,
     parse_unified_diff,
 )
 
@@ -81,6 +84,29 @@ class TestParseUnifiedDiff:
         assert hunks[0].new_start == 1
         assert hunks[1].new_start == 11
 
+    def test_parse_hunk_header_and_lines(self) -> None:
+        """Test that each hunk keeps its full header and only its own lines."""
+        patch = """\
+@@ -1,2 +1,2 @@ def main():
+-old
++new
+@@ -9 +9 @@
+@@ -20,1 +20,1 @@ class Foo:
+ context
+"""
+
+        hunks = parse_unified_diff(patch)
+
+        assert [hunk.header for hunk in hunks] == [
+            "@@ -1,2 +1,2 @@ def main():",
+            "@@ -9 +9 @@",
+            "@@ -20,1 +20,1 @@ class Foo:",
+        ]
+        assert hunks[0].lines == ["-old", "+new"]
+        assert hunks[1].lines == []
+        assert hunks[1].old_count == 1
+        assert hunks[2].lines == [" context", ""]
+
     def test_parse_empty_patch(self) -> None:
         """Test parsing an empty patch."""
         hunks = parse_unified_diff("")
@@ -183,6 +209,61 @@ class TestExtractChangedLines:
         lines = extract_changed_lines(patch)
         assert lines == []
 
+    def test_line_numbers_reset_per_hunk(self) -> None:
+        """Test that file headers are ignored and each hunk restarts numbering."""
+        patch = """\
+--- a/app.py
++++ b/app.py
+@@ -1,2 +1,2 @@ def main():
+-old
++new
+\\ No newline at end of file
+@@ -30 +30,2 @@
+ context
++added"""
+
+        lines = extract_changed_lines(patch)
+
+        assert [(line.old_line_number, line.new_line_number) for line in lines] == [
+            (1, None),
+            (None, 1),
+            (None, 31),
+        ]
+
+
+class TestGetLineAtPosition:
+    """Tests for mapping diff positions to new-file line numbers."""
+
+    PATCH = """\
+@@ -1,3 +1,3 @@
+ line1
+-old
++new
+@@ -10,2 +10,3 @@
+ line10
++inserted"""
+
+    @pytest.mark.parametrize(
+        ("position", "expected"),
+        [
+            (1, None),  # hunk header
+            (2, 1),
+            (3, None),  # removed line
+            (4, 2),
+            (6, 10),
+            (7, 11),
+            (0, None),
+            (8, None),
+        ],
+    )
+    def test_position_to_line(self, position: int, expected: int | None) -> None:
+        """Test converting diff positions, including out-of-range ones."""
+        assert get_line_at_position(self.PATCH, position) == expected
+
+    def test_none_patch(self) -> None:
+        """Test that binary files have no positions."""
+        assert get_line_at_position(None, 1) is None
+
 
 class TestDiffHunk:
     """Tests for DiffHunk data class."""
@@ -203,6 +284,13 @@ class TestDiffHunk:
         assert hunk.new_start == 1
         assert hunk.new_count == 4
 
+    def test_parsed_objects_use_slots(self) -> None:
+        """Test that hunks and changed lines don't carry a per-instance __dict__."""
+        patch = "@@ -1 +1 @@\n-old\n+new"
+
+        assert not hasattr(parse_unified_diff(patch)[0], "__dict__")
+        assert not hasattr(extract_changed_lines(patch)[0], "__dict__")
+
     def test_hunk_is_addition(self) -> None:
         """Test detecting a pure addition hunk."""
         hunk = DiffHunk(
@@ -8,14 +8,25 @@ from github import GithubException
 
 from app.tools.github import (
     GitHubToolError,
+    clear_client_cache,
+    clear_pr_cache,
     create_github_client,
     get_file_content,
     get_file_diff,
+    get_files_content_bulk,
     get_pr_metadata,
+    list_pr_filenames,
     list_pr_files,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_pr_cache() -> None:
+    """Keep cached clients and PR lookups from leaking between tests."""
+    clear_client_cache()
+    clear_pr_cache()
+
+
 class TestCreateGitHubClient:
     """Tests for GitHub client creation."""
 
@@ -30,6 +41,21 @@ class TestCreateGitHubClient:
             assert client is not None
             mock_integration.return_value.get_github_for_installation.assert_called_once_with(12345)
 
+    def test_client_reused_per_installation(self, set_mock_env: None) -> None:  # noqa: ARG002
+        """Test that one integration and one client per installation are reused."""
+        with patch("app.tools.github.GithubIntegration") as mock_integration:
+            get_client = mock_integration.return_value.get_github_for_installation
+            get_client.side_effect = lambda installation_id: MagicMock(name=str(installation_id))
+
+            first = create_github_client(installation_id=12345)
+            again = create_github_client(installation_id=12345)
+            other = create_github_client(installation_id=67890)
+
+        assert first is again
+        assert other is not first
+        mock_integration.assert_called_once()
+        assert get_client.call_count == 2
+
     def test_create_client_missing_app_id(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that missing APP_ID raises error."""
         monkeypatch.setenv("GITHUB_PRIVATE_KEY", "test-key")
@@ -60,13 +86,14 @@ class TestGetPrMetadata:
         mock_pr.user.login = "author"
         mock_pr.base.ref = "main"
         mock_pr.head.ref = "feature"
+        mock_pr.head.sha = "abc123def456abc123def456abc123def456abc1"
         mock_pr.changed_files = 5
         mock_pr.additions = 100
         mock_pr.deletions = 50
 
         mock_repo = MagicMock()
         mock_repo.get_pull.return_value = mock_pr
-        mock_client.get_repo.return_value = mock_repo
+        mock_client.withLazy.return_value.get_repo.return_value = mock_repo
 
         result = get_pr_metadata(
             client=mock_client,
@@ -78,13 +105,23 @@ class TestGetPrMetadata:
         assert result["body"] == "PR description"
         assert result["author"] == "author"
         assert result["files_changed"] == 5
+        assert result["head_sha"] == "abc123def456abc123def456abc123def456abc1"
+
+    def test_repository_and_pull_request_are_lazy(self) -> None:
+        """Test that tools resolve the repository and PR without fetching them."""
+        mock_client = MagicMock()
+
+        list_pr_files(client=mock_client, pr_number=42, repository="owner/repo")
+
+        mock_client.withLazy.assert_called_once_with(True)
+        mock_client.get_repo.assert_not_called()
 
     def test_get_metadata_pr_not_found(self) -> None:
         """Test handling PR not found error."""
         mock_client = MagicMock()
         mock_repo = MagicMock()
         mock_repo.get_pull.side_effect = GithubException(404, {"message": "Not Found"}, {})
-        mock_client.get_repo.return_value = mock_repo
+        mock_client.withLazy.return_value.get_repo.return_value = mock_repo
 
         with pytest.raises(GitHubToolError, match="not found"):
             get_pr_metadata(
@@ -93,6 +130,48 @@ class TestGetPrMetadata:
                 repository="owner/repo",
             )
 
+    def test_get_metadata_is_cached(self) -> None:
+        """Test that repeated lookups within the TTL reuse the first response."""
+        mock_client = MagicMock()
+        mock_client.withLazy.return_value.get_repo.return_value.get_pull.return_value.title = (
+            "Test PR"
+        )
+
+        first = get_pr_metadata(client=mock_client, pr_number=42, repository="owner/repo")
+        second = get_pr_metadata(client=mock_client, pr_number=42, repository="owner/repo")
+
+        assert first == second
+        mock_client.withLazy.return_value.get_repo.assert_called_once()
+
+    def test_get_metadata_refetched_after_invalidation(self) -> None:
+        """Test that invalidating a PR forces a fresh lookup."""
+        from app.tools.github import invalidate_pr_cache  # noqa: PLC0415
+
+        mock_client = MagicMock()
+
+        get_pr_metadata(client=mock_client, pr_number=42, repository="owner/repo")
+        invalidate_pr_cache("owner/repo", 42)
+        get_pr_metadata(client=mock_client, pr_number=42, repository="owner/repo")
+
+        assert mock_client.withLazy.return_value.get_repo.call_count == 2
+
+    def test_tools_share_pull_request(self) -> None:
+        """Test that metadata, file listing and diffs reuse one PR fetch."""
+        mock_client = MagicMock()
+        mock_repo = mock_client.withLazy.return_value.get_repo.return_value
+        mock_file = MagicMock()
+        mock_file.filename = "test.py"
+        mock_repo.get_pull.return_value.get_files.return_value = [mock_file]
+
+        get_pr_metadata(client=mock_client, pr_number=42, repository="owner/repo")
+        list_pr_files(client=mock_client, pr_number=42, repository="owner/repo")
+        get_file_diff(
+            client=mock_client, pr_number=42, repository="owner/repo", file_path="test.py"
+        )
+
+        mock_client.withLazy.return_value.get_repo.assert_called_once_with("owner/repo")
+        mock_repo.get_pull.assert_called_once_with(42)
+
 
 class TestListPrFiles:
     """Tests for list_pr_files tool."""
@@ -117,7 +196,7 @@ class TestListPrFiles:
 
         mock_repo = MagicMock()
         mock_repo.get_pull.return_value = mock_pr
-        mock_client.get_repo.return_value = mock_repo
+        mock_client.withLazy.return_value.get_repo.return_value = mock_repo
 
         result = list_pr_files(
             client=mock_client,
@@ -137,7 +216,7 @@ class TestListPrFiles:
 
         mock_repo = MagicMock()
         mock_repo.get_pull.return_value = mock_pr
-        mock_client.get_repo.return_value = mock_repo
+        mock_client.withLazy.return_value.get_repo.return_value = mock_repo
 
         result = list_pr_files(
             client=mock_client,
@@ -147,6 +226,55 @@ class TestListPrFiles:
 
         assert result == []
 
+    def test_list_filenames_omits_patches(self) -> None:
+        """Test that the filename listing drops patches but diffs still have them."""
+        mock_client = MagicMock()
+        mock_file = MagicMock()
+        mock_file.filename = "test.py"
+        mock_file.patch = "@@ -1 +1 @@\n-old\n+new"
+        mock_pr = mock_client.withLazy.return_value.get_repo.return_value.get_pull.return_value
+        mock_pr.get_files.return_value = [mock_file]
+
+        names = list_pr_filenames(client=mock_client, pr_number=42, repository="owner/repo")
+        diff = get_file_diff(
+            client=mock_client, pr_number=42, repository="owner/repo", file_path="test.py"
+        )
+
+        assert names[0]["filename"] == "test.py"
+        assert "patch" not in names[0]
+        assert diff["patch"] == mock_file.patch
+        mock_pr.get_files.assert_called_once()
+
+    def test_listed_files_are_copies(self) -> None:
+        """Test that editing a listed file leaves the cached entry intact."""
+        mock_client = MagicMock()
+        mock_file = MagicMock()
+        mock_file.filename = "test.py"
+        mock_pr = mock_client.withLazy.return_value.get_repo.return_value.get_pull.return_value
+        mock_pr.get_files.return_value = [mock_file]
+
+        listed = list_pr_files(client=mock_client, pr_number=42, repository="owner/repo")
+        listed[0]["patch"] = "edited"
+
+        again = list_pr_files(client=mock_client, pr_number=42, repository="owner/repo")
+        diff = get_file_diff(
+            client=mock_client, pr_number=42, repository="owner/repo", file_path="test.py"
+        )
+        assert again[0]["patch"] == diff["patch"] == mock_file.patch
+
+    def test_files_cached_per_head(self) -> None:
+        """Test that a new head SHA is never served the previous head's files."""
+        mock_client = MagicMock()
+        mock_pr = mock_client.withLazy.return_value.get_repo.return_value.get_pull.return_value
+        mock_pr.get_files.return_value = []
+
+        for head_sha in ("a" * 40, "a" * 40, "b" * 40):
+            list_pr_files(
+                client=mock_client, pr_number=42, repository="owner/repo", head_sha=head_sha
+            )
+
+        assert mock_pr.get_files.call_count == 2
+
 
 class TestGetFileDiff:
     """Tests for get_file_diff tool."""
@@ -166,7 +294,7 @@ class TestGetFileDiff:
 
         mock_repo = MagicMock()
         mock_repo.get_pull.return_value = mock_pr
-        mock_client.get_repo.return_value = mock_repo
+        mock_client.withLazy.return_value.get_repo.return_value = mock_repo
 
         result = get_file_diff(
             client=mock_client,
@@ -190,7 +318,7 @@ class TestGetFileDiff:
 
         mock_repo = MagicMock()
         mock_repo.get_pull.return_value = mock_pr
-        mock_client.get_repo.return_value = mock_repo
+        mock_client.withLazy.return_value.get_repo.return_value = mock_repo
 
         with pytest.raises(GitHubToolError, match="not found"):
             get_file_diff(
@@ -200,6 +328,26 @@ class TestGetFileDiff:
                 file_path="missing.py",
             )
 
+    def test_diffs_share_file_listing(self) -> None:
+        """Test that listing files and fetching several diffs paginate files once."""
+        mock_client = MagicMock()
+        mock_files = [MagicMock(), MagicMock()]
+        mock_files[0].filename = "a.py"
+        mock_files[1].filename = "b.py"
+        mock_pr = mock_client.withLazy.return_value.get_repo.return_value.get_pull.return_value
+        mock_pr.get_files.return_value = mock_files
+
+        list_pr_files(client=mock_client, pr_number=42, repository="owner/repo")
+        first = get_file_diff(
+            client=mock_client, pr_number=42, repository="owner/repo", file_path="a.py"
+        )
+        second = get_file_diff(
+            client=mock_client, pr_number=42, repository="owner/repo", file_path="b.py"
+        )
+
+        assert (first["filename"], second["filename"]) == ("a.py", "b.py")
+        mock_pr.get_files.assert_called_once()
+
 
 class TestGetFileContent:
     """Tests for get_file_content tool."""
@@ -215,7 +363,7 @@ class TestGetFileContent:
 
         mock_repo = MagicMock()
         mock_repo.get_contents.return_value = mock_content
-        mock_client.get_repo.return_value = mock_repo
+        mock_client.withLazy.return_value.get_repo.return_value = mock_repo
 
         result = get_file_content(
             client=mock_client,
@@ -227,12 +375,31 @@ class TestGetFileContent:
         assert result["content"] == content
         assert result["sha"] == "abc123"
 
+    def test_get_content_line_wrapped_base64(self) -> None:
+        """Test decoding GitHub's line-wrapped base64 with non-ASCII text."""
+        mock_client = MagicMock()
+        content = "# héllo\n" * 50
+        mock_content = (
+            mock_client.withLazy.return_value.get_repo.return_value.get_contents.return_value
+        )
+        mock_content.content = base64.encodebytes(content.encode()).decode()
+        mock_content.encoding = "base64"
+
+        result = get_file_content(
+            client=mock_client,
+            repository="owner/repo",
+            file_path="test.py",
+            ref="main",
+        )
+
+        assert result["content"] == content
+
     def test_get_content_file_not_found(self) -> None:
         """Test handling file not found."""
         mock_client = MagicMock()
         mock_repo = MagicMock()
         mock_repo.get_contents.side_effect = GithubException(404, {"message": "Not Found"}, {})
-        mock_client.get_repo.return_value = mock_repo
+        mock_client.withLazy.return_value.get_repo.return_value = mock_repo
 
         with pytest.raises(GitHubToolError, match="not found"):
             get_file_content(
@@ -241,3 +408,36 @@ class TestGetFileContent:
                 file_path="missing.py",
                 ref="main",
             )
+
+
+class TestGetFilesContentBulk:
+    """Tests for get_files_content_bulk tool."""
+
+    def test_results_keep_request_order(self) -> None:
+        """Test that concurrently fetched contents come back in request order."""
+        mock_client = MagicMock()
+
+        def get_contents(path: str, ref: str) -> MagicMock:
+            content = MagicMock()
+            content.content = base64.b64encode(f"{ref}:{path}".encode()).decode()
+            content.encoding = "base64"
+            return content
+
+        mock_client.withLazy.return_value.get_repo.return_value.get_contents.side_effect = (
+            get_contents
+        )
+        refs_and_paths = [("main", f"file{i}.py") for i in range(10)] + [("dev", "x.py")]
+
+        results = get_files_content_bulk(mock_client, "owner/repo", refs_and_paths)
+
+        assert [r["content"] for r in results] == [f"{ref}:{path}" for ref, path in refs_and_paths]
+
+    def test_error_propagates(self) -> None:
+        """Test that a failed fetch raises GitHubToolError."""
+        mock_client = MagicMock()
+        mock_client.withLazy.return_value.get_repo.return_value.get_contents.side_effect = (
+            GithubException(404, {"message": "Not Found"}, {})
+        )
+
+        with pytest.raises(GitHubToolError, match="not found"):
+            get_files_content_bulk(mock_client, "owner/repo", [("main", "a.py"), ("main", "b.py")])
@@ -59,6 +59,26 @@ class TestJsonFormatter:
         assert parsed["pr_number"] == 42
         assert parsed["repository"] == "owner/repo"
 
+    def test_format_with_unserializable_extra(self) -> None:
+        """Test that extra values JSON can't encode are rendered with str()."""
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+        record.labels = {"bug", "urgent"}
+        record.context = {"path": "a.py", "state": {1}}
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["labels"] == str(record.labels)
+        assert parsed["context"] == {"path": "a.py", "state": "{1}"}
+
     def test_format_with_exception(self) -> None:
         """Test formatting with exception info."""
         formatter = JsonFormatter()
@@ -136,6 +156,13 @@ class TestGetLogger:
 
         assert logger.name == "reviewbot.mymodule"
 
+    def test_get_logger_returns_same_logger(self) -> None:
+        """Test that repeated lookups return the logging module's singleton."""
+        logger = get_logger("mymodule")
+
+        assert get_logger("mymodule") is logger
+        assert logging.getLogger("reviewbot.mymodule") is logger
+
     def test_get_logger_uses_json_format(self) -> None:
         """Test that logger uses JSON format."""
         configure_logging()
@@ -1,5 +1,6 @@
 """Unit tests for data models."""
 
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import pytest
@@ -14,12 +15,35 @@ from app.models.comment import (
 from app.models.config import AgentConfig
 from app.models.file_diff import FileDiff, FileStatus
 from app.models.pull_request import PullRequest
-from app.models.session import ReviewSession, ReviewState
+from app.models.session import VALID_TRANSITIONS, ReviewSession, ReviewState
 
 
 class TestFileDiff:
     """Tests for FileDiff model."""
 
+    @pytest.mark.parametrize(
+        ("filename", "extension"),
+        [
+            ("src/main.py", "py"),
+            ("docs/README.MD", "md"),
+            ("archive.tar.gz", "gz"),
+            ("Makefile", ""),
+            (".gitignore", ""),
+            ("conf.d/nginx", ""),
+        ],
+    )
+    def test_file_extension(self, filename: str, extension: str) -> None:
+        """Test deriving the lowercased file extension."""
+        diff = FileDiff(
+            filename=filename,
+            status=FileStatus.MODIFIED,
+            additions=1,
+            deletions=0,
+            sha="abc123def456abc123def456abc123def456abc1",
+        )
+
+        assert diff.file_extension == extension
+
     def test_create_modified_file(self) -> None:
         """Test creating a modified file diff."""
         diff = FileDiff(
@@ -79,6 +103,19 @@ class TestFileDiff:
 
         assert diff.is_binary is True
 
+    def test_status_string_normalized_to_enum(self) -> None:
+        """Test that a raw status string is stored as the FileStatus member."""
+        diff = FileDiff(
+            filename="deleted.py",
+            status="removed",  # type: ignore[arg-type]
+            additions=0,
+            deletions=30,
+            sha="abc123def456abc123def456abc123def456abc1",
+        )
+
+        assert diff.status is FileStatus.REMOVED
+        assert diff.is_binary is False
+
     def test_renamed_file(self) -> None:
         """Test creating a renamed file diff."""
         diff = FileDiff(
@@ -226,6 +263,88 @@ class TestReviewComment:
             )
             assert comment.category == category
 
+    def test_comment_type_normalized_to_enum(self) -> None:
+        """Test that a plain string comment type becomes the enum member."""
+        comment = ReviewComment(
+            body="Test",
+            comment_type="summary",  # type: ignore[arg-type]
+            severity=Severity.INFO,
+            category=Category.STYLE,
+        )
+
+        assert comment.comment_type is CommentType.SUMMARY
+        assert comment.is_inline is False
+
+    def test_comment_uses_slots(self) -> None:
+        """Test that comments don't carry a per-instance __dict__."""
+        comment = ReviewComment(
+            body="Test",
+            comment_type=CommentType.SUMMARY,
+            severity=Severity.INFO,
+            category=Category.STYLE,
+        )
+
+        assert not hasattr(comment, "__dict__")
+
+    @pytest.mark.parametrize(
+        ("severity", "prefix"),
+        [
+            (Severity.ERROR, ":x: **ERROR**"),
+            (Severity.WARNING, ":warning: **WARNING**"),
+            (Severity.INFO, ":information_source: **INFO**"),
+            (Severity.PRAISE, ":star: **PRAISE**"),
+        ],
+    )
+    def test_format_with_metadata(self, severity: Severity, prefix: str) -> None:
+        """Test that formatted comments carry severity and category."""
+        comment = ReviewComment(
+            body="Check this",
+            comment_type=CommentType.SUMMARY,
+            severity=severity,
+            category=Category.BUG,
+        )
+
+        assert comment.format_with_metadata() == f"{prefix} (bug): Check this"
+
+
+class TestPullRequest:
+    """Tests for PullRequest model."""
+
+    def test_from_webhook_payload(self, sample_pr_payload: dict[str, Any]) -> None:
+        """Test building a PR and reading its owner and repo name."""
+        pr = PullRequest.from_webhook_payload(sample_pr_payload)
+
+        assert pr.number == 42
+        assert pr.owner == "owner"
+        assert pr.repo_name == "repo"
+
+    @pytest.mark.parametrize(
+        ("section", "key", "value", "message"),
+        [
+            ("repository", "full_name", "not-a-repo", "Invalid repository"),
+            ("repository", "full_name", "owner/repo/extra", "Invalid repository"),
+            ("head", "sha", "abc123", "Invalid SHA"),
+            ("head", "sha", "ABC123DEF456ABC123DEF456ABC123DEF456ABC1", "Invalid SHA"),
+            ("head", "sha", "g" * 40, "Invalid SHA"),
+        ],
+    )
+    def test_rejects_invalid_fields(
+        self,
+        sample_pr_payload: dict[str, Any],
+        section: str,
+        key: str,
+        value: str,
+        message: str,
+    ) -> None:
+        """Test that malformed repository names and SHAs are rejected."""
+        if section == "head":
+            sample_pr_payload["pull_request"]["head"][key] = value
+        else:
+            sample_pr_payload[section][key] = value
+
+        with pytest.raises(ValueError, match=message):
+            PullRequest.from_webhook_payload(sample_pr_payload)
+
 
 class TestReviewSession:
     """Tests for ReviewSession model."""
@@ -304,6 +423,39 @@ class TestReviewSession:
         assert session.state == ReviewState.FAILED
         assert session.completed_at is not None
 
+    def test_duration_and_completed_at(
+        self, sample_pr: PullRequest, sample_config: AgentConfig
+    ) -> None:
+        """Test that duration and completion time are recorded once the session ends."""
+        session = ReviewSession(pull_request=sample_pr, config=sample_config)
+        assert session.duration_seconds is None
+        assert session.completed_at is None
+
+        session.fail("boom")
+
+        duration = session.duration_seconds
+        assert duration is not None
+        assert duration >= 0
+        assert session.completed_at is not None
+        assert duration == (session.completed_at - session.started_at).total_seconds()
+
+    def test_completed_at_can_be_given(
+        self, sample_pr: PullRequest, sample_config: AgentConfig
+    ) -> None:
+        """Test that an explicit completion time is kept and used for the duration."""
+        started_at = datetime(2025, 1, 1, tzinfo=UTC)
+        completed_at = started_at + timedelta(seconds=90)
+
+        session = ReviewSession(
+            pull_request=sample_pr,
+            config=sample_config,
+            started_at=started_at,
+            completed_at=completed_at,
+        )
+
+        assert session.completed_at == completed_at
+        assert session.duration_seconds == 90
+
     def test_invalid_transition_raises_error(
         self, sample_pr: PullRequest, sample_config: AgentConfig
     ) -> None:
@@ -313,6 +465,22 @@ class TestReviewSession:
         with pytest.raises(ValueError, match="Invalid transition"):
             session.transition_to(ReviewState.COMPLETED)
 
+    @pytest.mark.parametrize("current", list(ReviewState))
+    def test_transitions_match_table(
+        self, sample_pr: PullRequest, sample_config: AgentConfig, current: ReviewState
+    ) -> None:
+        """Test that every state pair is accepted exactly when the table allows it."""
+        for new_state in ReviewState:
+            session = ReviewSession(pull_request=sample_pr, config=sample_config)
+            session.state = current
+
+            if new_state in VALID_TRANSITIONS[current]:
+                session.transition_to(new_state)
+                assert session.state == new_state
+            else:
+                with pytest.raises(ValueError, match="Invalid transition"):
+                    session.transition_to(new_state)
+
     def test_completed_state_is_terminal(
         self, sample_pr: PullRequest, sample_config: AgentConfig
     ) -> None:
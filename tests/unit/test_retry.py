@@ -1,6 +1,7 @@
 """Unit tests for retry with backoff utility."""
 
 import time
+from dataclasses import FrozenInstanceError
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -42,6 +43,28 @@ class TestRetryConfig:
         assert config.exponential_base == 3.0
         assert config.jitter is False
 
+    def test_config_is_frozen_and_hashable(self) -> None:
+        """Test that configs are immutable, so their precomputed delays stay valid."""
+        config = RetryConfig(base_delay=0.5)
+
+        with pytest.raises(FrozenInstanceError):
+            config.base_delay = 2.0  # type: ignore[misc]
+
+        assert hash(config) == hash(RetryConfig(base_delay=0.5))
+        assert not hasattr(config, "__dict__")
+
+    def test_calculate_delay_beyond_max_retries(self) -> None:
+        """Test that delays past the precomputed retries are still calculated."""
+        config = RetryConfig(max_retries=2, base_delay=1.0, max_delay=5.0, jitter=False)
+
+        assert [config.calculate_delay(attempt) for attempt in range(5)] == [
+            1.0,
+            2.0,
+            4.0,
+            5.0,
+            5.0,
+        ]
+
 
 class TestRetryWithBackoff:
     """Tests for synchronous retry with backoff."""
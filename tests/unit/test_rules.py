@@ -6,7 +6,13 @@ from pathlib import Path
 import pytest
 
 from app.models.rule import ReviewRule
-from app.rules.loader import RuleLoader
+from app.rules.loader import RuleLoader, clear_rule_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_rule_cache() -> None:
+    """Keep cached rules from leaking between tests."""
+    clear_rule_cache()
 
 
 class TestReviewRule:
@@ -51,6 +57,20 @@ class TestReviewRule:
                 priority=-1,
             )
 
+    @pytest.mark.parametrize(
+        ("content", "title"),
+        [
+            ("# Security\n\nNo secrets in code.", "Security"),
+            ("\n\n  ## Naming  \nUse snake_case.", "Naming"),
+            ("Plain rule without heading\n# Later heading", "api.rules"),
+        ],
+    )
+    def test_title(self, content: str, title: str) -> None:
+        """Test taking the title from a leading heading or the filename."""
+        rule = ReviewRule(source_file="api.rules.md", content=content, priority=0)
+
+        assert rule.title == title
+
 
 class TestRuleLoader:
     """Tests for RuleLoader."""
@@ -184,3 +204,35 @@ class TestRuleLoader:
             # Should only load the valid file
             assert len(rules) == 1
             assert rules[0].source_file == "valid.md"
+
+    def test_reuses_unchanged_rules(self) -> None:
+        """Test that unchanged files are served from the cache and edits are picked up."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rules_dir = Path(tmpdir)
+            rule_file = rules_dir / "style.md"
+            rule_file.write_text("# Style\n\nUse black.")
+
+            loader = RuleLoader()
+            first = loader.load_from_directory(rules_dir)
+            second = loader.load_from_directory(rules_dir)
+
+            assert second[0] is first[0]
+
+            rule_file.write_text("# Style\n\nUse ruff format.")
+            third = loader.load_from_directory(rules_dir)
+
+            assert third[0].content == "# Style\n\nUse ruff format."
+
+    def test_reads_many_files_in_order(self) -> None:
+        """Test that concurrently read files keep alphabetical priority order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rules_dir = Path(tmpdir)
+            for i in range(12):
+                (rules_dir / f"{i:02d}-rule.md").write_text(f"# Rule {i}")
+            (rules_dir / "05a-empty.md").write_text("   ")
+            (rules_dir / "05b-binary.md").write_bytes(b"\xff\xfe\x00")
+
+            rules = RuleLoader().load_from_directory(rules_dir)
+
+            assert [rule.title for rule in rules] == [f"Rule {i}" for i in range(12)]
+            assert [rule.priority for rule in rules] == sorted(rule.priority for rule in rules)
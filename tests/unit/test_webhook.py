@@ -3,6 +3,7 @@
 import hashlib
 import hmac
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -13,6 +14,7 @@ from app.webhook.handler import (
     parse_ping_event,
     parse_pr_event,
 )
+from app.webhook.pipeline import process_webhook
 from app.webhook.validators import WebhookSignatureError, verify_webhook_signature
 
 
@@ -37,6 +39,34 @@ class TestVerifyWebhookSignature:
         with pytest.raises(WebhookSignatureError):
             verify_webhook_signature(payload, signature, secret)
 
+    def test_uses_constant_time_signature_check(self) -> None:
+        """Test that digests are compared with hmac.compare_digest, not ==."""
+        secret = "test-secret"
+        payload = b'{"action": "opened"}'
+        signature = "sha256=" + hmac.digest(secret.encode(), payload, "sha256").hex()
+
+        with patch(
+            "app.webhook.validators.hmac.compare_digest", wraps=hmac.compare_digest
+        ) as mock_compare:
+            verify_webhook_signature(payload, signature, secret)
+
+        mock_compare.assert_called_once()
+
+    def test_non_hex_signature(self) -> None:
+        """Test that a digest that isn't hex is rejected as malformed."""
+        with pytest.raises(WebhookSignatureError, match="not hex"):
+            verify_webhook_signature(b"{}", "sha256=" + "zz" * 32, "test-secret")
+
+    def test_wrong_length_rejected_before_hashing(self) -> None:
+        """Test that a truncated digest is rejected without computing the HMAC."""
+        with (
+            patch("app.webhook.validators.hmac.new") as mock_hmac,
+            pytest.raises(WebhookSignatureError, match="length"),
+        ):
+            verify_webhook_signature(b"{}", "sha256=" + "ab" * 31, "test-secret")
+
+        mock_hmac.assert_not_called()
+
     def test_missing_prefix(self) -> None:
         """Test that signature without sha256= prefix raises error."""
         secret = "test-secret"
@@ -160,6 +190,17 @@ class TestWebhookHandler:
         assert result["action"] == "synchronize"
         assert result["should_review"] is True
 
+    def test_dispatch_pr_synchronize_invalidates_cache(
+        self, sample_pr_payload: dict[str, Any]
+    ) -> None:
+        """Test that new commits drop cached PR metadata and files."""
+        sample_pr_payload["action"] = "synchronize"
+        handler = WebhookHandler()
+        with patch("app.webhook.handler.invalidate_pr_cache") as mock_invalidate:
+            handler.dispatch("pull_request", sample_pr_payload)
+
+        mock_invalidate.assert_called_once_with("owner/repo", 42)
+
     def test_dispatch_pr_closed(self, sample_pr_payload: dict[str, Any]) -> None:
         """Test dispatching a PR closed event (should not trigger review)."""
         sample_pr_payload["action"] = "closed"
@@ -197,3 +238,74 @@ class TestWebhookHandler:
 
         assert result["event_type"] == "installation"
         assert result["status"] == "ok"
+
+    def test_handles_matches_dispatch(self) -> None:
+        """Test that handles() reports exactly the events dispatch routes."""
+        handler = WebhookHandler()
+
+        assert all(handler.handles(event) for event in ("pull_request", "ping", "installation"))
+        assert not handler.handles("push")
+        assert handler.dispatch("push", {})["status"] == "ignored"
+
+
+class TestProcessWebhook:
+    """Tests for the runtime-independent webhook pipeline."""
+
+    SECRET = "test-secret"
+
+    def _sign(self, body: bytes) -> str:
+        """Sign a body with the test secret."""
+        return "sha256=" + hmac.digest(self.SECRET.encode(), body, "sha256").hex()
+
+    def test_dispatches_verified_event(self) -> None:
+        """Test that a signed event is parsed and dispatched."""
+        body = b'{"zen": "Keep it simple."}'
+
+        status, result = process_webhook(body, self._sign(body), "ping", "d-1", self.SECRET)
+
+        assert status == 200
+        assert result["event_type"] == "ping"
+        assert result["zen"] == "Keep it simple."
+
+    def test_missing_secret(self) -> None:
+        """Test that an unconfigured secret is a server error."""
+        status, result = process_webhook(b"{}", "sha256=abc", "ping", "d-1", "")
+
+        assert status == 500
+        assert result["error"] == "configuration_error"
+
+    def test_invalid_signature(self) -> None:
+        """Test that a bad signature is rejected."""
+        status, result = process_webhook(b"{}", "sha256=abc", "ping", "d-1", self.SECRET)
+
+        assert status == 403
+        assert result["error"] == "invalid_signature"
+
+    def test_invalid_json(self) -> None:
+        """Test that a signed but malformed body is rejected."""
+        body = b"not json"
+
+        status, result = process_webhook(body, self._sign(body), "ping", "d-1", self.SECRET)
+
+        assert status == 400
+        assert result["error"] == "invalid_payload"
+        assert result["message"].startswith("Invalid JSON")
+
+    def test_non_object_json(self) -> None:
+        """Test that a signed JSON body that isn't an object is rejected."""
+        body = b"[1, 2]"
+
+        status, result = process_webhook(body, self._sign(body), "ping", "d-1", self.SECRET)
+
+        assert status == 400
+        assert result["error"] == "invalid_payload"
+        assert "JSON object" in result["message"]
+
+    def test_unhandled_event_skips_verification(self) -> None:
+        """Test that unhandled events are ignored before the signature check."""
+        with patch("app.webhook.pipeline.verify_webhook_signature") as mock_verify:
+            status, result = process_webhook(b"{}", "", "push", "d-1", self.SECRET)
+
+        mock_verify.assert_not_called()
+        assert status == 200
+        assert result == {"event_type": "push", "status": "ignored"}